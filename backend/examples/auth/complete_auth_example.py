@@ -12,6 +12,8 @@ Features:
 """
 
 import asyncio
+import time
+from cachetools import TTLCache
 from typing import Optional, Dict, Any
 from datetime import datetime
 
@@ -27,16 +29,60 @@ class AuthenticationService:
     together to implement a complete authentication system.
     """
     
-    def __init__(self, jwt_service: JWTService, user_repository: UserRepository):
+    def __init__(self, jwt_service: JWTService, user_repository: UserRepository,
+                 cache_verified_tokens: bool = False, password_hasher: Optional[Any] = None):
         """
         Initialize authentication service.
         
         Args:
             jwt_service: JWT service instance
             user_repository: User repository instance
+            cache_verified_tokens: Memoize verified token payloads by token string
+            password_hasher: Object providing hash_password/verify_password (defaults to jwt_service)
         """
         self.jwt_service = jwt_service
         self.user_repository = user_repository
+        self.password_hasher = password_hasher or jwt_service
+        self.cache_verified_tokens = cache_verified_tokens
+        # token string -> verified payload; entries are removed one at a time
+        self._payload_cache = TTLCache(maxsize=1024, ttl=300)
+    
+    def _decode_token(self, token: str) -> Dict[str, Any]:
+        """Verify a token string with the JWT service and return its payload."""
+        return self.jwt_service.verify_token(JWTToken(token))
+    
+    def _verified_payload(self, token: str) -> Dict[str, Any]:
+        """
+        Get the verified payload for a token, using the cache when enabled.
+        
+        Cached entries are dropped once the token expires or is revoked, so
+        the result is the same as calling the JWT service directly.
+        
+        Args:
+            token: JWT token string
+            
+        Returns:
+            Token payload as dictionary
+        """
+        if not self.cache_verified_tokens:
+            return self._decode_token(token)
+        
+        payload = self._payload_cache.get(token)
+        if payload is None:
+            payload = self._decode_token(token)
+            self._payload_cache[token] = dict(payload)
+            return payload
+        
+        exp = payload.get("exp")
+        if (exp is not None and exp <= time.time()) or self.jwt_service.is_token_revoked(JWTToken(token)):
+            self._payload_cache.pop(token, None)
+            return self._decode_token(token)
+        # Callers get their own copy; the cached payload must not change
+        return dict(payload)
+    
+    def clear_cache(self) -> None:
+        """Drop every cached token payload."""
+        self._payload_cache.clear()
     
     async def register_user(self, email: str, password: str, first_name: str, last_name: str) -> Dict[str, Any]:
         """
@@ -69,8 +115,8 @@ class AuthenticationService:
             if not last_name or not last_name.strip():
                 raise ValueError("Last name is required")
             
-            # Hash password
-            password_hash = self.jwt_service.hash_password(password)
+            # Hash password (bcrypt is CPU-bound, keep it off the event loop)
+            password_hash = await asyncio.to_thread(self.password_hasher.hash_password, password)
             
             # Create user
             user = await self.user_repository.create_user(
@@ -140,7 +186,7 @@ class AuthenticationService:
                 }
             
             # Verify password
-            if not self.jwt_service.verify_password(password, user.password_hash):
+            if not await asyncio.to_thread(self.password_hasher.verify_password, password, user.password_hash):
                 return {
                     "success": False,
                     "message": "Invalid email or password"
@@ -188,11 +234,8 @@ class AuthenticationService:
             Dictionary with verification result and user info
         """
         try:
-            # Create JWT token object
-            jwt_token = JWTToken(token)
-            
             # Verify token
-            payload = self.jwt_service.verify_token(jwt_token)
+            payload = self._verified_payload(token)
             
             # Get user from database
             user = await self.user_repository.get_user_by_id(payload["user_id"])
@@ -226,6 +269,31 @@ class AuthenticationService:
                 "message": f"Token verification failed: {e}"
             }
     
+    async def logout_user(self, token: str) -> Dict[str, Any]:
+        """
+        Logout a user by revoking their token.
+        
+        Args:
+            token: JWT token to revoke
+            
+        Returns:
+            Dictionary with logout result
+        """
+        try:
+            self.jwt_service.revoke_token(JWTToken(token))
+            self._payload_cache.pop(token, None)
+            
+            return {
+                "success": True,
+                "message": "Logout successful"
+            }
+            
+        except Exception as e:
+            return {
+                "success": False,
+                "message": f"Logout failed: {e}"
+            }
+    
     async def get_user_profile(self, user_id: int) -> Dict[str, Any]:
         """
         Get user profile by ID.
@@ -372,6 +440,7 @@ async def main():
         token = login_result["token"]
     else:
         print(f"❌ {login_result['message']}")
+        await auth_service.user_repository.close()
         return
     
     # Example 3: Verify token
@@ -433,6 +502,8 @@ async def main():
         print(f"❌ {invalid_verify['message']}")
     
     print("\n🎉 Authentication example completed!")
+    
+    await auth_service.user_repository.close()
 
 
 if __name__ == "__main__":
@@ -6,31 +6,67 @@ for the authentication examples testing suite.
 """
 
 import pytest
+import bcrypt
+import copy
+import sqlite3
 import tempfile
 import os
 import asyncio
 from datetime import datetime, timedelta
-from unittest.mock import Mock, AsyncMock, patch
+from unittest.mock import Mock, patch
 from typing import Dict, Any, List
 
 from jwt_service_example import JWTService, JWTToken
-from user_repository_example import UserRepository, User
+from user_repository_example import UserRepository, User, UserRepositoryError, UserAlreadyExistsError, UserRepositoryConnectionError
 from complete_auth_example import AuthenticationService
 
 
+# Real bcrypt salt generator, kept for tests that check the production cost
+_REAL_GENSALT = bcrypt.gensalt
+
+
 # Pytest configuration
+@pytest.fixture(scope="session", autouse=True)
+def fast_bcrypt():
+    """Hash passwords with bcrypt cost 4 for the whole session."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(bcrypt, "gensalt", lambda rounds=4, prefix=b"2b": _REAL_GENSALT(rounds=4, prefix=prefix))
+        yield
+
+
+@pytest.fixture
+def real_bcrypt(monkeypatch):
+    """Restore the real bcrypt cost factor for a single test."""
+    monkeypatch.setattr(bcrypt, "gensalt", _REAL_GENSALT)
+
+
 @pytest.fixture(scope="session")
 def event_loop():
-    """Create an instance of the default event loop for the test session."""
+    """
+    Create an instance of the default event loop for the test session.
+    
+    Every async test in every module runs on this one loop, so modules
+    should not override event_loop with a narrower scope.
+    """
     loop = asyncio.get_event_loop_policy().new_event_loop()
     yield loop
     loop.close()
 
 
 # Database fixtures
+@pytest.fixture(scope="session")
+def temp_database(worker_id):
+    """Create an in-memory database shared by the test session (one per xdist worker)."""
+    database_uri = f"file:auth_tests_{worker_id}?mode=memory&cache=shared"
+    # The shared in-memory database lives as long as one connection is open
+    keeper = sqlite3.connect(database_uri, uri=True)
+    yield database_uri
+    keeper.close()
+
+
 @pytest.fixture
-def temp_database():
-    """Create a temporary database for testing."""
+def temp_database_file():
+    """Create a temporary on-disk database for testing."""
     temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
     temp_db.close()
     yield temp_db.name
@@ -39,23 +75,45 @@ def temp_database():
         os.unlink(temp_db.name)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def user_repository(temp_database):
     """Create a user repository with temporary database."""
     repo = UserRepository(temp_database)
     yield repo
+    await repo.close()
 
 
-# JWT Service fixtures
 @pytest.fixture
+async def user_repository_factory():
+    """Build extra user repositories whose connections are closed after the test."""
+    repos = []
+    
+    def factory(database_path: str) -> UserRepository:
+        repo = UserRepository(database_path)
+        repos.append(repo)
+        return repo
+    
+    yield factory
+    for repo in repos:
+        await repo.close()
+
+
+# JWT Service fixtures
+@pytest.fixture(scope="session")
 def jwt_service():
     """Create a JWT service for testing."""
     return JWTService("test-secret-key")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def jwt_token(jwt_service):
-    """Create a valid JWT token for testing."""
+    """Create a valid JWT token shared by read-only tests in a module."""
+    return jwt_service.create_token(1, "test@example.com", "customer")
+
+
+@pytest.fixture
+def fresh_jwt_token(jwt_service):
+    """Create a valid JWT token for tests that revoke or otherwise consume it."""
     return jwt_service.create_token(1, "test@example.com", "customer")
 
 
@@ -82,6 +140,12 @@ def sample_user():
     )
 
 
+@pytest.fixture(scope="session")
+def mock_user():
+    """Shared read-only user returned by repository mocks."""
+    return User(1, "test@example.com", "hash", "John", "Doe")
+
+
 @pytest.fixture
 def sample_users():
     """Create multiple sample users."""
@@ -114,19 +178,89 @@ def sample_users():
 
 
 # Authentication service fixtures
+class FakeHasher:
+    """Reversible stand-in for bcrypt when only the match result matters."""
+    
+    def hash_password(self, password: str) -> str:
+        return "h:" + password
+    
+    def verify_password(self, password: str, hashed: str) -> bool:
+        return hashed == "h:" + password
+
+
+@pytest.fixture(scope="session")
+async def auth_service(jwt_service, user_repository):
+    """Create an authentication service for testing (passwords are not bcrypt-hashed)."""
+    return AuthenticationService(
+        jwt_service, user_repository, cache_verified_tokens=True, password_hasher=FakeHasher()
+    )
+
+
+@pytest.fixture
+async def uncached_auth_service(jwt_service, user_repository):
+    """Create an authentication service with the default, uncached token verification."""
+    return AuthenticationService(jwt_service, user_repository, password_hasher=FakeHasher())
+
+
+@pytest.fixture
+async def bcrypt_auth_service(jwt_service, user_repository):
+    """Create an authentication service that hashes passwords with bcrypt."""
+    return AuthenticationService(jwt_service, user_repository)
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_state(request):
+    """Wipe the shared database and service state after each test."""
+    yield
+    
+    if "temp_database" in request.fixturenames:
+        conn = sqlite3.connect(request.getfixturevalue("temp_database"), uri=True)
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        if "users" in tables:
+            conn.execute("DELETE FROM users")
+        if "sqlite_sequence" in tables:
+            conn.execute("DELETE FROM sqlite_sequence WHERE name = 'users'")
+        conn.commit()
+        conn.close()
+    
+    if "user_repository" in request.fixturenames:
+        request.getfixturevalue("user_repository").clear_cache()
+    
+    if "jwt_service" in request.fixturenames:
+        request.getfixturevalue("jwt_service").revoked_tokens.clear()
+    
+    if "auth_service" in request.fixturenames:
+        request.getfixturevalue("auth_service").clear_cache()
+
+
 @pytest.fixture
-async def auth_service(temp_database):
-    """Create an authentication service for testing."""
-    jwt_service = JWTService("test-secret-key")
-    user_repo = UserRepository(temp_database)
-    return AuthenticationService(jwt_service, user_repo)
+async def registered_user(auth_service):
+    """Register a test user for negative-path tests."""
+    credentials = {"email": "test@example.com", "password": "SecurePassword123!"}
+    result = await auth_service.register_user(
+        credentials["email"], credentials["password"], "John", "Doe"
+    )
+    return {**credentials, "user": result["user"]}
 
 
 # Mock fixtures
+@pytest.fixture(scope="session")
+def _jwt_mock_prototype():
+    """Spec'd JWT service mock, introspected once per session."""
+    return Mock(spec=JWTService)
+
+
+@pytest.fixture(scope="session")
+def _user_repo_mock_prototype():
+    """Spec'd user repository mock, introspected once per session."""
+    return Mock(spec=UserRepository)
+
+
 @pytest.fixture
-def mock_jwt_service():
+def mock_jwt_service(_jwt_mock_prototype):
     """Create a mock JWT service."""
-    mock = Mock(spec=JWTService)
+    mock = copy.copy(_jwt_mock_prototype)
+    mock.reset_mock(return_value=True, side_effect=True)
     mock.create_token.return_value = JWTToken("mock_token")
     mock.verify_token.return_value = {"user_id": 1, "email": "test@example.com", "role": "customer"}
     mock.hash_password.return_value = "$2b$12$mock_hash"
@@ -137,16 +271,10 @@ def mock_jwt_service():
 
 
 @pytest.fixture
-def mock_user_repository():
-    """Create a mock user repository."""
-    mock = Mock(spec=UserRepository)
-    mock.create_user = AsyncMock()
-    mock.get_user_by_email = AsyncMock()
-    mock.get_user_by_id = AsyncMock()
-    mock.update_user = AsyncMock()
-    mock.delete_user = AsyncMock()
-    mock.list_users = AsyncMock()
-    mock.count_users = AsyncMock()
+def mock_user_repository(_user_repo_mock_prototype):
+    """Create a mock user repository (async methods are AsyncMocks via spec)."""
+    mock = copy.copy(_user_repo_mock_prototype)
+    mock.reset_mock(return_value=True, side_effect=True)
     return mock
 
 
@@ -205,16 +333,40 @@ def invalid_login_data():
 
 
 # Database test data
+async def _bulk_insert_users(repo: UserRepository, users: List[User]) -> None:
+    """Insert users in a single transaction, bypassing per-call validation.
+    
+    Args:
+        repo: Repository whose database receives the rows
+        users: Users to insert (ids are assigned by SQLite)
+    """
+    rows = [
+        (user.email, user.password_hash, user.first_name, user.last_name,
+         (user.created_at or datetime.now()).isoformat())
+        for user in users
+    ]
+    conn = sqlite3.connect(repo.database_path, uri=repo._uri)
+    try:
+        with conn:
+            conn.executemany(
+                "INSERT INTO users (email, password_hash, first_name, last_name, created_at) VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+    finally:
+        conn.close()
+    repo.clear_cache()
+
+
+@pytest.fixture
+def bulk_create_users():
+    """Helper that inserts a list of users in one transaction."""
+    return _bulk_insert_users
+
+
 @pytest.fixture
 async def populated_database(user_repository, sample_users):
     """Populate database with test users."""
-    for user in sample_users:
-        await user_repository.create_user(
-            user.email,
-            user.password_hash,
-            user.first_name,
-            user.last_name
-        )
+    await _bulk_insert_users(user_repository, sample_users)
     return sample_users
 
 
@@ -239,13 +391,13 @@ def database_error_simulation():
     """Simulate database errors."""
     def _simulate_error(error_type: str):
         if error_type == "connection":
-            raise Exception("Database connection failed")
+            raise UserRepositoryConnectionError("Database connection failed")
         elif error_type == "constraint":
-            raise Exception("UNIQUE constraint failed")
+            raise UserAlreadyExistsError("UNIQUE constraint failed")
         elif error_type == "timeout":
-            raise Exception("Database timeout")
+            raise TimeoutError("Database timeout")
         else:
-            raise Exception("Unknown database error")
+            raise UserRepositoryError("Unknown database error")
     return _simulate_error
 
 
@@ -317,6 +469,7 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "slow: Slow running tests")
     config.addinivalue_line("markers", "security: Security tests")
     config.addinivalue_line("markers", "performance: Performance tests")
+    config.addinivalue_line("markers", "bcrypt: Tests that exercise real bcrypt hashing")
 
 
 # Test collection hooks
@@ -348,11 +501,11 @@ def pytest_html_report_title(report):
 
 def pytest_html_results_table_header(cells):
     """Customize HTML report table header."""
-    cells.insert(1, html.th('Coverage'))
-    cells.insert(2, html.th('Duration'))
+    cells.insert(1, '<th>Coverage</th>')
+    cells.insert(2, '<th>Duration</th>')
 
 
 def pytest_html_results_table_row(report, cells):
     """Customize HTML report table rows."""
-    cells.insert(1, html.td(report.coverage))
-    cells.insert(2, html.td(report.duration))
+    cells.insert(1, f'<td>{getattr(report, "coverage", "")}</td>')
+    cells.insert(2, f'<td>{report.duration:.3f}s</td>')
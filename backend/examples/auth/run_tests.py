@@ -131,13 +131,14 @@ def run_mocking_tests():
 
 
 def run_all_tests():
-    """Run all tests with coverage."""
+    """Run all tests with coverage, in parallel across CPU cores."""
     print("\n🚀 Running All Tests with Coverage...")
     
     result = run_command(
         [
             "python", "-m", "pytest",
             "test_*.py",
+            "-n", "auto",
             "-v",
             "--cov=.",
             "--cov-report=term-missing",
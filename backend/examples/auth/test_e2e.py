@@ -16,7 +16,7 @@ from unittest.mock import patch, Mock, AsyncMock
 from typing import Dict, Any, List
 
 from jwt_service_example import JWTService, JWTToken
-from user_repository_example import UserRepository, User
+from user_repository_example import User
 from complete_auth_example import AuthenticationService
 
 
@@ -194,7 +194,7 @@ class TestAuthenticationE2E:
     
     @pytest.mark.e2e
     @pytest.mark.asyncio
-    async def test_token_expiration_and_refresh_flow(self, auth_service):
+    async def test_token_expiration_and_refresh_flow(self, auth_service, user_repository_factory):
         """Test token expiration and refresh flow."""
         # Register and login user
         await auth_service.register_user(
@@ -213,7 +213,7 @@ class TestAuthenticationE2E:
         
         # Simulate token expiration by creating a new service with short expiration
         jwt_service = JWTService("test-secret", access_token_expire_hours=0.0001)  # Very short expiration
-        user_repo = UserRepository(auth_service.user_repository.database_path)
+        user_repo = user_repository_factory(auth_service.user_repository.database_path)
         expired_auth_service = AuthenticationService(jwt_service, user_repo)
         
         # Create token that will expire quickly
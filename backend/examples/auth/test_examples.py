@@ -133,16 +133,18 @@ class TestJWTService:
 class TestUserRepository:
     """Test cases for User Repository"""
     
-    def setup_method(self):
-        """Setup test fixtures"""
+    @pytest.fixture(autouse=True)
+    async def repository(self):
+        """Setup and cleanup test fixtures"""
         # Create temporary database
         self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
         self.temp_db.close()
         self.user_repo = UserRepository(self.temp_db.name)
-    
-    def teardown_method(self):
-        """Cleanup test fixtures"""
-        # Remove temporary database
+        
+        yield
+        
+        # Close the connection and remove temporary database
+        await self.user_repo.close()
         if os.path.exists(self.temp_db.name):
             os.unlink(self.temp_db.name)
     
@@ -286,8 +288,9 @@ class TestUserRepository:
 class TestAuthenticationService:
     """Test cases for complete authentication service"""
     
-    def setup_method(self):
-        """Setup test fixtures"""
+    @pytest.fixture(autouse=True)
+    async def service(self):
+        """Setup and cleanup test fixtures"""
         # Create temporary database
         self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
         self.temp_db.close()
@@ -297,10 +300,11 @@ class TestAuthenticationService:
             jwt_secret="test-secret-key",
             db_path=self.temp_db.name
         )
-    
-    def teardown_method(self):
-        """Cleanup test fixtures"""
-        # Remove temporary database
+        
+        yield
+        
+        # Close the connection and remove temporary database
+        await self.auth_service.user_repository.close()
         if os.path.exists(self.temp_db.name):
             os.unlink(self.temp_db.name)
     
@@ -16,7 +16,7 @@ from unittest.mock import patch, Mock
 from typing import List, Dict, Any
 
 from jwt_service_example import JWTService, JWTToken
-from user_repository_example import UserRepository, User
+from user_repository_example import User
 from complete_auth_example import AuthenticationService
 
 
@@ -25,13 +25,13 @@ class TestDatabaseIntegration:
     
     @pytest.mark.integration
     @pytest.mark.asyncio
-    async def test_database_connection_and_initialization(self, temp_database):
+    async def test_database_connection_and_initialization(self, temp_database_file, user_repository_factory):
         """Test database connection and table creation."""
         # Create repository (this should initialize database)
-        repo = UserRepository(temp_database)
+        repo = user_repository_factory(temp_database_file)
         
         # Verify database file exists
-        assert os.path.exists(temp_database)
+        assert os.path.exists(temp_database_file)
         
         # Verify tables exist by trying to insert a user
         user = await repo.create_user("test@example.com", "hash", "John", "Doe")
@@ -47,9 +47,9 @@ class TestDatabaseIntegration:
     
     @pytest.mark.integration
     @pytest.mark.asyncio
-    async def test_database_transaction_rollback(self, temp_database):
+    async def test_database_transaction_rollback(self, temp_database, user_repository_factory):
         """Test database transaction rollback on error."""
-        repo = UserRepository(temp_database)
+        repo = user_repository_factory(temp_database)
         
         # Create a user
         user1 = await repo.create_user("user1@example.com", "hash1", "User", "One")
@@ -65,9 +65,9 @@ class TestDatabaseIntegration:
     
     @pytest.mark.integration
     @pytest.mark.asyncio
-    async def test_database_concurrent_operations(self, temp_database):
+    async def test_database_concurrent_operations(self, temp_database, user_repository_factory):
         """Test concurrent database operations."""
-        repo = UserRepository(temp_database)
+        repo = user_repository_factory(temp_database)
         
         # Create multiple users concurrently
         async def create_user(email_suffix):
@@ -94,9 +94,9 @@ class TestDatabaseIntegration:
     
     @pytest.mark.integration
     @pytest.mark.asyncio
-    async def test_database_pagination_performance(self, temp_database):
+    async def test_database_pagination_performance(self, temp_database, user_repository_factory):
         """Test database pagination performance with large dataset."""
-        repo = UserRepository(temp_database)
+        repo = user_repository_factory(temp_database)
         
         # Create 100 users
         for i in range(100):
@@ -129,9 +129,9 @@ class TestDatabaseIntegration:
     
     @pytest.mark.integration
     @pytest.mark.asyncio
-    async def test_database_constraint_violations(self, temp_database):
+    async def test_database_constraint_violations(self, temp_database, user_repository_factory):
         """Test database constraint violations."""
-        repo = UserRepository(temp_database)
+        repo = user_repository_factory(temp_database)
         
         # Test unique email constraint
         await repo.create_user("test@example.com", "hash1", "John", "Doe")
@@ -145,9 +145,9 @@ class TestDatabaseIntegration:
     
     @pytest.mark.integration
     @pytest.mark.asyncio
-    async def test_database_connection_pooling(self, temp_database):
+    async def test_database_connection_pooling(self, temp_database, user_repository_factory):
         """Test database connection handling."""
-        repo = UserRepository(temp_database)
+        repo = user_repository_factory(temp_database)
         
         # Perform multiple operations to test connection handling
         for i in range(50):
@@ -296,10 +296,10 @@ class TestServiceIntegration:
     
     @pytest.mark.integration
     @pytest.mark.asyncio
-    async def test_jwt_service_with_user_repository(self, temp_database):
+    async def test_jwt_service_with_user_repository(self, temp_database, user_repository_factory):
         """Test JWT service integration with user repository."""
         jwt_service = JWTService("test-secret")
-        user_repo = UserRepository(temp_database)
+        user_repo = user_repository_factory(temp_database)
         
         # Create user
         user = await user_repo.create_user(
@@ -355,7 +355,7 @@ class TestServiceIntegration:
     
     @pytest.mark.integration
     @pytest.mark.asyncio
-    async def test_authentication_service_error_scenarios(self, auth_service):
+    async def test_authentication_service_error_scenarios(self, auth_service, registered_user):
         """Test authentication service error scenarios."""
         # Test login with non-existent user
         login_result = await auth_service.login_user(
@@ -364,12 +364,8 @@ class TestServiceIntegration:
         assert login_result["success"] is False
         
         # Test login with wrong password
-        await auth_service.register_user(
-            "test@example.com", "SecurePassword123!", "John", "Doe"
-        )
-        
         wrong_login = await auth_service.login_user(
-            "test@example.com", "WrongPassword"
+            registered_user["email"], "WrongPassword"
         )
         assert wrong_login["success"] is False
         
@@ -457,6 +453,33 @@ class TestServiceIntegration:
         assert updated_profile["user"]["first_name"] == "Johnny"
         assert updated_profile["user"]["last_name"] == "Doe"  # Should remain unchanged
 
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_authentication_service_token_cache_logout(self, auth_service):
+        """Test cached token verification is invalidated on logout."""
+        await auth_service.register_user(
+            "test@example.com", "SecurePassword123!", "John", "Doe"
+        )
+        login_result = await auth_service.login_user(
+            "test@example.com", "SecurePassword123!"
+        )
+        token = login_result["token"]
+
+        # Repeated verification is served from the cache
+        first = await auth_service.verify_token(token)
+        second = await auth_service.verify_token(token)
+        assert first["success"] is True
+        assert second["token_payload"] == first["token_payload"]
+        assert token in auth_service._payload_cache
+
+        # Logout revokes the token and drops the cached payload
+        logout_result = await auth_service.logout_user(token)
+        assert logout_result["success"] is True
+        assert token not in auth_service._payload_cache
+
+        verify_result = await auth_service.verify_token(token)
+        assert verify_result["success"] is False
+
 
 class TestPerformanceIntegration:
     """Integration tests for performance scenarios"""
@@ -464,9 +487,9 @@ class TestPerformanceIntegration:
     @pytest.mark.integration
     @pytest.mark.slow
     @pytest.mark.asyncio
-    async def test_large_dataset_performance(self, temp_database):
+    async def test_large_dataset_performance(self, temp_database, user_repository_factory):
         """Test performance with large dataset."""
-        user_repo = UserRepository(temp_database)
+        user_repo = user_repository_factory(temp_database)
         
         # Create 1000 users
         start_time = datetime.now()
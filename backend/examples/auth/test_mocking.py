@@ -9,13 +9,78 @@ Target: Comprehensive mocking tests for external dependencies
 
 import pytest
 import asyncio
-from datetime import datetime, timedelta
-from unittest.mock import Mock, patch, AsyncMock, MagicMock
-from typing import Dict, Any, List
+import copy
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest.mock import Mock, AsyncMock, MagicMock
 
-from jwt_service_example import JWTService, JWTToken, JWTServiceError
-from user_repository_example import UserRepository, User, UserRepositoryError
+from jwt_service_example import JWTToken, JWTServiceError
+from user_repository_example import UserRepository, UserRepositoryError, UserAlreadyExistsError, UserRepositoryConnectionError
 from complete_auth_example import AuthenticationService
+import jwt_service_example
+import user_repository_example
+import complete_auth_example
+
+
+@contextmanager
+def swap_attr(module, name, new):
+    """Temporarily replace a module attribute without mock.patch overhead."""
+    old = getattr(module, name)
+    setattr(module, name, new)
+    try:
+        yield new
+    finally:
+        setattr(module, name, old)
+
+
+_CURSOR_ROW = (1, "test@example.com", "hash", "John", "Doe", "2023-01-01")
+
+
+class _Recorder:
+    """Callable that only counts how many times it was called."""
+    __slots__ = ("calls",)
+    
+    def __init__(self):
+        self.calls = 0
+    
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+
+
+@pytest.fixture(autouse=True)
+def _reset_mocks(mock_jwt_service, mock_user_repository):
+    """Reset shared mocks after each test so prototype copies don't drift."""
+    yield
+    mock_jwt_service.reset_mock(return_value=True, side_effect=True)
+    mock_user_repository.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def mocked_auth_service(mock_jwt_service, mock_user_repository):
+    """Authentication service over this test's JWT service and repository mocks."""
+    return AuthenticationService(mock_jwt_service, mock_user_repository)
+
+
+@pytest.fixture(scope="module")
+def bench_loop():
+    """Private event loop for benchmarking coroutines from sync tests."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="module")
+def _async_repo_template():
+    """Spec'd AsyncMock repository, built once per module."""
+    return AsyncMock(spec=UserRepository)
+
+
+@pytest.fixture
+def async_repo_mock(_async_repo_template):
+    """Fresh view of the module AsyncMock repository template."""
+    mock = copy.copy(_async_repo_template)
+    mock.reset_mock(return_value=True, side_effect=True)
+    return mock
 
 
 class TestJWTServiceMocking:
@@ -39,32 +104,23 @@ class TestJWTServiceMocking:
         assert payload["email"] == "test@example.com"
     
     @pytest.mark.unit
-    def test_jwt_service_mock_error_scenarios(self):
+    @pytest.mark.parametrize("method, args, message", [
+        ("create_token", (1, "test@example.com", "customer"), "Token creation failed"),
+        ("verify_token", (JWTToken("mock_token"),), "Token verification failed"),
+        ("verify_token", (JWTToken("expired_token"),), "Token has expired"),
+        ("hash_password", ("password",), "Password hashing failed"),
+    ])
+    def test_jwt_service_mock_error_scenarios(self, mock_jwt_service, method, args, message):
         """Test JWT service mocking with error scenarios."""
-        mock_service = Mock(spec=JWTService)
-        
-        # Mock token creation failure
-        mock_service.create_token.side_effect = JWTServiceError("Token creation failed")
-        
-        with pytest.raises(JWTServiceError):
-            mock_service.create_token(1, "test@example.com", "customer")
-        
-        # Mock token verification failure
-        mock_service.verify_token.side_effect = JWTServiceError("Token verification failed")
+        getattr(mock_jwt_service, method).side_effect = JWTServiceError(message)
         
-        with pytest.raises(JWTServiceError):
-            mock_service.verify_token(JWTToken("mock_token"))
-        
-        # Mock password hashing failure
-        mock_service.hash_password.side_effect = JWTServiceError("Password hashing failed")
-        
-        with pytest.raises(JWTServiceError):
-            mock_service.hash_password("password")
+        with pytest.raises(JWTServiceError, match=message):
+            getattr(mock_jwt_service, method)(*args)
     
     @pytest.mark.unit
     def test_jwt_service_mock_with_patch(self):
-        """Test JWT service mocking with patch decorator."""
-        with patch('jwt_service_example.JWTService') as mock_jwt_class:
+        """Test JWT service mocking with a swapped module attribute."""
+        with swap_attr(jwt_service_example, "JWTService", MagicMock()) as mock_jwt_class:
             # Configure mock
             mock_instance = Mock()
             mock_instance.create_token.return_value = JWTToken("patched_token")
@@ -72,7 +128,7 @@ class TestJWTServiceMocking:
             mock_jwt_class.return_value = mock_instance
             
             # Create service
-            service = JWTService("secret")
+            service = jwt_service_example.JWTService("secret")
             
             # Test mocked behavior
             token = service.create_token(1, "test@example.com", "customer")
@@ -82,33 +138,20 @@ class TestJWTServiceMocking:
             assert payload["user_id"] == 1
     
     @pytest.mark.unit
-    def test_jwt_service_mock_token_expiration(self):
-        """Test JWT service mocking with token expiration."""
-        mock_service = Mock(spec=JWTService)
-        
-        # Mock expired token
-        mock_service.verify_token.side_effect = JWTServiceError("Token has expired")
-        
-        with pytest.raises(JWTServiceError):
-            mock_service.verify_token(JWTToken("expired_token"))
-    
-    @pytest.mark.unit
-    def test_jwt_service_mock_revocation(self):
+    def test_jwt_service_mock_revocation(self, mock_jwt_service):
         """Test JWT service mocking with token revocation."""
-        mock_service = Mock(spec=JWTService)
-        
         # Mock token revocation
-        mock_service.revoke_token.return_value = True
-        mock_service.is_token_revoked.return_value = True
+        mock_jwt_service.revoke_token.return_value = True
+        mock_jwt_service.is_token_revoked.return_value = True
         
         token = JWTToken("mock_token")
         
         # Test revocation
-        result = mock_service.revoke_token(token)
+        result = mock_jwt_service.revoke_token(token)
         assert result is True
         
         # Test revocation check
-        is_revoked = mock_service.is_token_revoked(token)
+        is_revoked = mock_jwt_service.is_token_revoked(token)
         assert is_revoked is True
 
 
@@ -117,10 +160,9 @@ class TestUserRepositoryMocking:
     
     @pytest.mark.unit
     @pytest.mark.asyncio
-    async def test_user_repository_mock_operations(self, mock_user_repository):
+    async def test_user_repository_mock_operations(self, mock_user, mock_user_repository):
         """Test User Repository mocking."""
         # Configure mock
-        mock_user = User(1, "test@example.com", "hash", "John", "Doe")
         mock_user_repository.create_user.return_value = mock_user
         mock_user_repository.get_user_by_email.return_value = mock_user
         mock_user_repository.get_user_by_id.return_value = mock_user
@@ -153,52 +195,32 @@ class TestUserRepositoryMocking:
     
     @pytest.mark.unit
     @pytest.mark.asyncio
-    async def test_user_repository_mock_error_scenarios(self):
-        """Test User Repository mocking with error scenarios."""
-        mock_repo = Mock(spec=UserRepository)
-        
-        # Mock user creation failure
-        mock_repo.create_user.side_effect = UserRepositoryError("Database connection failed")
-        
-        with pytest.raises(UserRepositoryError):
-            await mock_repo.create_user("test@example.com", "hash", "John", "Doe")
-        
-        # Mock user not found
-        mock_repo.get_user_by_email.return_value = None
-        mock_repo.get_user_by_id.return_value = None
-        
-        user = await mock_repo.get_user_by_email("nonexistent@example.com")
-        assert user is None
-        
-        user = await mock_repo.get_user_by_id(999)
-        assert user is None
-        
-        # Mock update failure
-        mock_repo.update_user.return_value = None
-        
-        updated = await mock_repo.update_user(999, {"first_name": "Test"})
-        assert updated is None
-        
-        # Mock delete failure
-        mock_repo.delete_user.return_value = False
-        
-        deleted = await mock_repo.delete_user(999)
-        assert deleted is False
+    @pytest.mark.parametrize("method, args, missing", [
+        ("get_user_by_email", ("nonexistent@example.com",), None),
+        ("get_user_by_id", (999,), None),
+        ("update_user", (999, {"first_name": "Test"}), None),
+        ("delete_user", (999,), False),
+    ])
+    async def test_user_repository_mock_error_scenarios(self, mock_user_repository, method, args, missing):
+        """Test User Repository mocking with missing-user scenarios."""
+        getattr(mock_user_repository, method).return_value = missing
+        
+        result = await getattr(mock_user_repository, method)(*args)
+        assert result is missing
     
     @pytest.mark.unit
     @pytest.mark.asyncio
-    async def test_user_repository_mock_with_patch(self):
-        """Test User Repository mocking with patch decorator."""
-        with patch('user_repository_example.UserRepository') as mock_repo_class:
+    async def test_user_repository_mock_with_patch(self, mock_user, async_repo_mock):
+        """Test User Repository mocking with a swapped module attribute."""
+        with swap_attr(user_repository_example, "UserRepository", MagicMock()) as mock_repo_class:
             # Configure mock
-            mock_instance = AsyncMock()
-            mock_user = User(1, "test@example.com", "hash", "John", "Doe")
+            mock_instance = async_repo_mock
             mock_instance.create_user.return_value = mock_user
             mock_instance.get_user_by_email.return_value = mock_user
             mock_repo_class.return_value = mock_instance
             
             # Create repository
-            repo = UserRepository("test.db")
+            repo = user_repository_example.UserRepository(":memory:")
             
             # Test mocked behavior
             user = await repo.create_user("test@example.com", "hash", "John", "Doe")
@@ -209,27 +231,17 @@ class TestUserRepositoryMocking:
     
     @pytest.mark.unit
     @pytest.mark.asyncio
-    async def test_user_repository_mock_database_errors(self):
+    @pytest.mark.parametrize("method, args, message", [
+        ("create_user", ("test@example.com", "hash", "John", "Doe"), "Database connection failed"),
+        ("create_user", ("test@example.com", "hash", "John", "Doe"), "UNIQUE constraint failed"),
+        ("get_user_by_email", ("test@example.com",), "Database timeout"),
+    ])
+    async def test_user_repository_mock_database_errors(self, mock_user_repository, method, args, message):
         """Test User Repository mocking with database errors."""
-        mock_repo = Mock(spec=UserRepository)
-        
-        # Mock database connection error
-        mock_repo.create_user.side_effect = UserRepositoryError("Database connection failed")
-        
-        with pytest.raises(UserRepositoryError):
-            await mock_repo.create_user("test@example.com", "hash", "John", "Doe")
-        
-        # Mock constraint violation
-        mock_repo.create_user.side_effect = UserRepositoryError("UNIQUE constraint failed")
-        
-        with pytest.raises(UserRepositoryError):
-            await mock_repo.create_user("test@example.com", "hash", "John", "Doe")
+        getattr(mock_user_repository, method).side_effect = UserRepositoryError(message)
         
-        # Mock timeout error
-        mock_repo.get_user_by_email.side_effect = UserRepositoryError("Database timeout")
-        
-        with pytest.raises(UserRepositoryError):
-            await mock_repo.get_user_by_email("test@example.com")
+        with pytest.raises(UserRepositoryError, match=message):
+            await getattr(mock_user_repository, method)(*args)
 
 
 class TestAuthenticationServiceMocking:
@@ -237,72 +249,65 @@ class TestAuthenticationServiceMocking:
     
     @pytest.mark.unit
     @pytest.mark.asyncio
-    async def test_authentication_service_mock_dependencies(self, mock_jwt_service, mock_user_repository):
+    async def test_authentication_service_mock_dependencies(self, mocked_auth_service, mock_user, mock_jwt_service, mock_user_repository):
         """Test Authentication Service with mocked dependencies."""
         # Configure mocks
-        mock_user = User(1, "test@example.com", "hash", "John", "Doe")
         mock_user_repository.create_user.return_value = mock_user
         mock_user_repository.get_user_by_email.return_value = mock_user
         mock_user_repository.get_user_by_id.return_value = mock_user
         
-        # Create service with mocked dependencies
-        auth_service = AuthenticationService(mock_jwt_service, mock_user_repository)
-        
         # Test registration
-        result = await auth_service.register_user(
+        result = await mocked_auth_service.register_user(
             "test@example.com", "password", "John", "Doe"
         )
         assert result["success"] is True
         
         # Test login
-        result = await auth_service.login_user("test@example.com", "password")
+        result = await mocked_auth_service.login_user("test@example.com", "password")
         assert result["success"] is True
         assert "token" in result
         
         # Test token verification
-        result = await auth_service.verify_token("mock_token")
+        result = await mocked_auth_service.verify_token("mock_token")
         assert result["success"] is True
         
         # Test profile retrieval
-        result = await auth_service.get_user_profile(1)
+        result = await mocked_auth_service.get_user_profile(1)
         assert result["success"] is True
         
         # Test profile update
-        result = await auth_service.update_user_profile(1, {"first_name": "Johnny"})
+        result = await mocked_auth_service.update_user_profile(1, {"first_name": "Johnny"})
         assert result["success"] is True
     
     @pytest.mark.unit
     @pytest.mark.asyncio
-    async def test_authentication_service_mock_failures(self, mock_jwt_service, mock_user_repository):
+    async def test_authentication_service_mock_failures(self, mocked_auth_service, mock_jwt_service, mock_user_repository):
         """Test Authentication Service with mocked failures."""
         # Configure mocks for failures
         mock_user_repository.create_user.side_effect = UserRepositoryError("Database error")
         mock_user_repository.get_user_by_email.return_value = None
         mock_jwt_service.verify_token.side_effect = JWTServiceError("Token verification failed")
         
-        # Create service with mocked dependencies
-        auth_service = AuthenticationService(mock_jwt_service, mock_user_repository)
-        
         # Test registration failure
-        result = await auth_service.register_user(
+        result = await mocked_auth_service.register_user(
             "test@example.com", "password", "John", "Doe"
         )
         assert result["success"] is False
         
         # Test login failure
-        result = await auth_service.login_user("test@example.com", "password")
+        result = await mocked_auth_service.login_user("test@example.com", "password")
         assert result["success"] is False
         
         # Test token verification failure
-        result = await auth_service.verify_token("invalid_token")
+        result = await mocked_auth_service.verify_token("invalid_token")
         assert result["success"] is False
     
     @pytest.mark.unit
     @pytest.mark.asyncio
-    async def test_authentication_service_mock_with_patch(self):
-        """Test Authentication Service with patch decorator."""
-        with patch('complete_auth_example.JWTService') as mock_jwt_class, \
-             patch('complete_auth_example.UserRepository') as mock_repo_class:
+    async def test_authentication_service_mock_with_patch(self, mock_user, async_repo_mock):
+        """Test Authentication Service with swapped module attributes."""
+        with swap_attr(complete_auth_example, "JWTService", MagicMock()) as mock_jwt_class, \
+             swap_attr(complete_auth_example, "UserRepository", MagicMock()) as mock_repo_class:
             
             # Configure mocks
             mock_jwt_instance = Mock()
@@ -311,8 +316,7 @@ class TestAuthenticationServiceMocking:
             mock_jwt_instance.hash_password.return_value = "hashed_password"
             mock_jwt_instance.verify_password.return_value = True
             
-            mock_repo_instance = AsyncMock()
-            mock_user = User(1, "test@example.com", "hash", "John", "Doe")
+            mock_repo_instance = async_repo_mock
             mock_repo_instance.create_user.return_value = mock_user
             mock_repo_instance.get_user_by_email.return_value = mock_user
             mock_repo_instance.get_user_by_id.return_value = mock_user
@@ -334,29 +338,29 @@ class TestAuthenticationServiceMocking:
             assert result["token"] == "patched_token"
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_authentication_service_mock_concurrent_operations(self, mock_jwt_service, mock_user_repository):
+    @pytest.mark.performance
+    def test_authentication_service_mock_concurrent_operations(self, benchmark, bench_loop, mocked_auth_service, mock_user, mock_jwt_service, mock_user_repository):
         """Test Authentication Service with mocked concurrent operations."""
-        # Configure mocks
-        mock_user = User(1, "test@example.com", "hash", "John", "Doe")
-        mock_user_repository.create_user.return_value = mock_user
-        mock_user_repository.get_user_by_email.return_value = mock_user
-        mock_user_repository.get_user_by_id.return_value = mock_user
+        # Configure mocks to yield to the event loop so gathered tasks interleave
+        async def yield_user(*args, **kwargs):
+            await asyncio.sleep(0)
+            return mock_user
         
-        # Create service
-        auth_service = AuthenticationService(mock_jwt_service, mock_user_repository)
+        mock_user_repository.create_user.side_effect = yield_user
+        mock_user_repository.get_user_by_email.side_effect = yield_user
+        mock_user_repository.get_user_by_id.side_effect = yield_user
         
         # Test concurrent operations
         async def register_and_login(user_id):
             email = f"user{user_id}@example.com"
             
             # Register user
-            register_result = await auth_service.register_user(
+            register_result = await mocked_auth_service.register_user(
                 email, "password", f"User{user_id}", f"Test{user_id}"
             )
             
             # Login user
-            login_result = await auth_service.login_user(email, "password")
+            login_result = await mocked_auth_service.login_user(email, "password")
             
             return {
                 "user_id": user_id,
@@ -365,8 +369,10 @@ class TestAuthenticationServiceMocking:
             }
         
         # Run concurrent operations
-        tasks = [register_and_login(i) for i in range(10)]
-        results = await asyncio.gather(*tasks)
+        async def run_concurrently():
+            return await asyncio.gather(*(register_and_login(i) for i in range(10)))
+        
+        results = benchmark(lambda: bench_loop.run_until_complete(run_concurrently()))
         
         # All operations should succeed
         assert len(results) == 10
@@ -379,11 +385,11 @@ class TestDatabaseMocking:
     """Mocking tests for database operations"""
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_database_connection_mocking(self, mock_database_connection):
+    def test_database_connection_mocking(self, mock_database_connection):
         """Test database connection mocking."""
         # Configure mock
-        mock_database_connection.cursor.return_value.fetchone.return_value = (1, "test@example.com", "hash", "John", "Doe", "2023-01-01")
+        cursor_stub = SimpleNamespace(fetchone=lambda: _CURSOR_ROW)
+        mock_database_connection.cursor = lambda: cursor_stub
         
         # Test database operations
         cursor = mock_database_connection.cursor()
@@ -393,54 +399,43 @@ class TestDatabaseMocking:
         assert result[1] == "test@example.com"
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_database_error_mocking(self, database_error_simulation):
+    def test_database_error_mocking(self, database_error_simulation):
         """Test database error mocking."""
         # Test connection error
-        with pytest.raises(Exception, match="Database connection failed"):
+        with pytest.raises(UserRepositoryConnectionError):
             database_error_simulation("connection")
         
         # Test constraint error
-        with pytest.raises(Exception, match="UNIQUE constraint failed"):
+        with pytest.raises(UserAlreadyExistsError):
             database_error_simulation("constraint")
         
         # Test timeout error
-        with pytest.raises(Exception, match="Database timeout"):
+        with pytest.raises(TimeoutError):
             database_error_simulation("timeout")
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_database_transaction_mocking(self):
+    def test_database_transaction_mocking(self):
         """Test database transaction mocking."""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_conn.cursor.return_value = mock_cursor
-        
-        # Mock successful transaction
-        mock_cursor.execute.return_value = None
-        mock_cursor.lastrowid = 1
-        mock_conn.commit.return_value = None
+        cursor = SimpleNamespace(execute=_Recorder(), lastrowid=1)
+        mock_conn = SimpleNamespace(cursor=lambda: cursor, commit=_Recorder(), rollback=_Recorder())
         
         # Test transaction
         cursor = mock_conn.cursor()
         cursor.execute("INSERT INTO users VALUES (?, ?, ?, ?, ?)", ("test@example.com", "hash", "John", "Doe", "2023-01-01"))
         mock_conn.commit()
         
-        # Verify mock calls
-        mock_cursor.execute.assert_called_once()
-        mock_conn.commit.assert_called_once()
+        # Verify recorded calls
+        assert cursor.execute.calls == 1
+        assert mock_conn.commit.calls == 1
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_database_rollback_mocking(self):
+    def test_database_rollback_mocking(self):
         """Test database rollback mocking."""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_conn.cursor.return_value = mock_cursor
+        def failing_execute(*args, **kwargs):
+            raise Exception("Database error")
         
-        # Mock transaction failure
-        mock_cursor.execute.side_effect = Exception("Database error")
-        mock_conn.rollback.return_value = None
+        cursor = SimpleNamespace(execute=failing_execute)
+        mock_conn = SimpleNamespace(cursor=lambda: cursor, commit=_Recorder(), rollback=_Recorder())
         
         # Test rollback
         try:
@@ -450,180 +445,133 @@ class TestDatabaseMocking:
             mock_conn.rollback()
         
         # Verify rollback was called
-        mock_conn.rollback.assert_called_once()
+        assert mock_conn.rollback.calls == 1
 
 
 class TestSecurityMocking:
     """Mocking tests for security scenarios"""
     
+    @pytest.fixture(scope="class")
+    def mock_jwt_service(self, _jwt_mock_prototype):
+        """JWT service mock shared by the whole class."""
+        return copy.copy(_jwt_mock_prototype)
+    
     @pytest.mark.unit
     @pytest.mark.security
-    def test_malicious_input_mocking(self, malicious_inputs):
+    @pytest.mark.parametrize("kind", ["sql_injection", "xss_script", "path_traversal"])
+    def test_malicious_input_mocking(self, mock_jwt_service, malicious_inputs, kind):
         """Test mocking with malicious inputs."""
-        mock_service = Mock(spec=JWTService)
-        
-        # Test SQL injection
-        sql_injection = malicious_inputs["sql_injection"]
-        mock_service.create_token.side_effect = JWTServiceError("Invalid input")
-        
-        with pytest.raises(JWTServiceError):
-            mock_service.create_token(1, sql_injection, "customer")
-        
-        # Test XSS
-        xss_input = malicious_inputs["xss_script"]
-        mock_service.create_token.side_effect = JWTServiceError("Invalid input")
-        
-        with pytest.raises(JWTServiceError):
-            mock_service.create_token(1, xss_input, "customer")
-        
-        # Test path traversal
-        path_traversal = malicious_inputs["path_traversal"]
-        mock_service.create_token.side_effect = JWTServiceError("Invalid input")
+        mock_jwt_service.create_token.side_effect = JWTServiceError("Invalid input")
         
         with pytest.raises(JWTServiceError):
-            mock_service.create_token(1, path_traversal, "customer")
+            mock_jwt_service.create_token(1, malicious_inputs[kind], "customer")
     
     @pytest.mark.unit
     @pytest.mark.security
-    def test_token_security_mocking(self):
+    def test_token_security_mocking(self, mock_jwt_service):
         """Test token security mocking."""
-        mock_service = Mock(spec=JWTService)
-        
         # Mock token revocation
-        mock_service.revoke_token.return_value = True
-        mock_service.is_token_revoked.return_value = True
+        mock_jwt_service.revoke_token.return_value = True
+        mock_jwt_service.is_token_revoked.return_value = True
         
         token = JWTToken("security_token")
         
         # Test revocation
-        result = mock_service.revoke_token(token)
+        result = mock_jwt_service.revoke_token(token)
         assert result is True
         
         # Test revocation check
-        is_revoked = mock_service.is_token_revoked(token)
+        is_revoked = mock_jwt_service.is_token_revoked(token)
         assert is_revoked is True
         
         # Mock token verification failure
-        mock_service.verify_token.side_effect = JWTServiceError("Token has been revoked")
+        mock_jwt_service.verify_token.side_effect = JWTServiceError("Token has been revoked")
         
         with pytest.raises(JWTServiceError):
-            mock_service.verify_token(token)
+            mock_jwt_service.verify_token(token)
     
     @pytest.mark.unit
     @pytest.mark.security
-    def test_password_security_mocking(self):
+    def test_password_security_mocking(self, mock_jwt_service):
         """Test password security mocking."""
-        mock_service = Mock(spec=JWTService)
-        
         # Mock password hashing
-        mock_service.hash_password.return_value = "$2b$12$secure_hash"
+        mock_jwt_service.hash_password.return_value = "$2b$12$secure_hash"
         
-        hashed = mock_service.hash_password("SecurePassword123!")
+        hashed = mock_jwt_service.hash_password("SecurePassword123!")
         assert hashed == "$2b$12$secure_hash"
         
         # Mock password verification
-        mock_service.verify_password.return_value = True
+        mock_jwt_service.verify_password.return_value = True
         
-        is_valid = mock_service.verify_password("SecurePassword123!", hashed)
+        is_valid = mock_jwt_service.verify_password("SecurePassword123!", hashed)
         assert is_valid is True
         
         # Mock password verification failure
-        mock_service.verify_password.return_value = False
+        mock_jwt_service.verify_password.return_value = False
         
-        is_valid = mock_service.verify_password("WrongPassword", hashed)
+        is_valid = mock_jwt_service.verify_password("WrongPassword", hashed)
         assert is_valid is False
 
 
 class TestPerformanceMocking:
     """Mocking tests for performance scenarios"""
     
+    @pytest.fixture(scope="class")
+    def mock_jwt_service(self, _jwt_mock_prototype):
+        """JWT service mock shared by the whole class."""
+        return copy.copy(_jwt_mock_prototype)
+    
+    @pytest.fixture(scope="class")
+    def mock_user_repository(self, _user_repo_mock_prototype):
+        """User repository mock shared by the whole class."""
+        return copy.copy(_user_repo_mock_prototype)
+    
     @pytest.mark.unit
     @pytest.mark.performance
-    def test_jwt_service_performance_mocking(self):
+    def test_jwt_service_performance_mocking(self, benchmark, mock_jwt_service):
         """Test JWT service performance mocking."""
-        mock_service = Mock(spec=JWTService)
+        mock_jwt_service.create_token.return_value = JWTToken("fast_token")
+        mock_jwt_service.verify_token.return_value = {"user_id": 1, "email": "test@example.com"}
         
-        # Mock fast token creation
-        mock_service.create_token.return_value = JWTToken("fast_token")
+        def create_and_verify():
+            token = mock_jwt_service.create_token(1, "test@example.com", "customer")
+            return token, mock_jwt_service.verify_token(token)
         
-        start_time = datetime.now()
-        token = mock_service.create_token(1, "test@example.com", "customer")
-        end_time = datetime.now()
+        token, payload = benchmark(create_and_verify)
         
-        # Should be fast
-        assert (end_time - start_time).total_seconds() < 0.1
         assert token.value == "fast_token"
-        
-        # Mock fast token verification
-        mock_service.verify_token.return_value = {"user_id": 1, "email": "test@example.com"}
-        
-        start_time = datetime.now()
-        payload = mock_service.verify_token(token)
-        end_time = datetime.now()
-        
-        # Should be fast
-        assert (end_time - start_time).total_seconds() < 0.1
         assert payload["user_id"] == 1
     
     @pytest.mark.unit
     @pytest.mark.performance
-    @pytest.mark.asyncio
-    async def test_user_repository_performance_mocking(self):
+    def test_user_repository_performance_mocking(self, benchmark, bench_loop, mock_user, mock_user_repository):
         """Test User Repository performance mocking."""
-        mock_repo = Mock(spec=UserRepository)
+        mock_user_repository.create_user.return_value = mock_user
+        mock_user_repository.get_user_by_email.return_value = mock_user
         
-        # Mock fast user creation
-        mock_user = User(1, "test@example.com", "hash", "John", "Doe")
-        mock_repo.create_user.return_value = mock_user
+        async def create_and_get():
+            user = await mock_user_repository.create_user("test@example.com", "hash", "John", "Doe")
+            return user, await mock_user_repository.get_user_by_email("test@example.com")
         
-        start_time = datetime.now()
-        user = await mock_repo.create_user("test@example.com", "hash", "John", "Doe")
-        end_time = datetime.now()
+        user, retrieved = benchmark(lambda: bench_loop.run_until_complete(create_and_get()))
         
-        # Should be fast
-        assert (end_time - start_time).total_seconds() < 0.1
         assert user.id == 1
-        
-        # Mock fast user retrieval
-        mock_repo.get_user_by_email.return_value = mock_user
-        
-        start_time = datetime.now()
-        retrieved = await mock_repo.get_user_by_email("test@example.com")
-        end_time = datetime.now()
-        
-        # Should be fast
-        assert (end_time - start_time).total_seconds() < 0.1
         assert retrieved.id == 1
     
     @pytest.mark.unit
     @pytest.mark.performance
-    @pytest.mark.asyncio
-    async def test_authentication_service_performance_mocking(self, mock_jwt_service, mock_user_repository):
+    def test_authentication_service_performance_mocking(self, benchmark, bench_loop, mock_user, mock_user_repository, mocked_auth_service):
         """Test Authentication Service performance mocking."""
-        # Configure mocks
-        mock_user = User(1, "test@example.com", "hash", "John", "Doe")
         mock_user_repository.create_user.return_value = mock_user
         mock_user_repository.get_user_by_email.return_value = mock_user
         
-        # Create service
-        auth_service = AuthenticationService(mock_jwt_service, mock_user_repository)
-        
-        # Test fast registration
-        start_time = datetime.now()
-        result = await auth_service.register_user(
-            "test@example.com", "password", "John", "Doe"
-        )
-        end_time = datetime.now()
-        
-        # Should be fast
-        assert (end_time - start_time).total_seconds() < 0.1
-        assert result["success"] is True
+        async def register_and_login():
+            registered = await mocked_auth_service.register_user(
+                "test@example.com", "password", "John", "Doe"
+            )
+            return registered, await mocked_auth_service.login_user("test@example.com", "password")
         
-        # Test fast login
-        start_time = datetime.now()
-        result = await auth_service.login_user("test@example.com", "password")
-        end_time = datetime.now()
+        registered, logged_in = benchmark(lambda: bench_loop.run_until_complete(register_and_login()))
         
-        # Should be fast
-        assert (end_time - start_time).total_seconds() < 0.1
-        assert result["success"] is True
+        assert registered["success"] is True
+        assert logged_in["success"] is True
@@ -9,6 +9,8 @@ Target: >85% coverage with comprehensive unit testing
 
 import pytest
 import asyncio
+import bcrypt
+import sqlite3
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch, AsyncMock
 from typing import Dict, Any
@@ -22,6 +24,15 @@ from user_repository_example import (
 from complete_auth_example import AuthenticationService
 
 
+async def _user_exists(repo: UserRepository, user_id: int) -> bool:
+    """Check for a user row without building a User entity."""
+    conn = sqlite3.connect(repo.database_path, uri=repo._uri)
+    try:
+        return conn.execute("SELECT 1 FROM users WHERE id = ? LIMIT 1", (user_id,)).fetchone() is not None
+    finally:
+        conn.close()
+
+
 class TestJWTServiceComprehensive:
     """Comprehensive unit tests for JWT service"""
     
@@ -88,20 +99,18 @@ class TestJWTServiceComprehensive:
         assert "iat" in payload
     
     @pytest.mark.unit
-    def test_verify_token_invalid_format(self, jwt_service):
+    @pytest.mark.parametrize("invalid_token", [
+        "invalid.token",
+        "not.a.jwt.token",
+        "",
+        "single",
+        "two.parts",
+        "too.many.parts.here.extra"
+    ])
+    def test_verify_token_invalid_format(self, jwt_service, invalid_token):
         """Test verification of invalid token format."""
-        invalid_tokens = [
-            "invalid.token",
-            "not.a.jwt.token",
-            "",
-            "single",
-            "two.parts",
-            "too.many.parts.here.extra"
-        ]
-        
-        for invalid_token in invalid_tokens:
-            with pytest.raises(InvalidTokenError):
-                jwt_service.verify_token(JWTToken(invalid_token))
+        with pytest.raises(InvalidTokenError):
+            jwt_service.verify_token(JWTToken(invalid_token))
     
     @pytest.mark.unit
     def test_verify_token_expired(self, expired_jwt_token, jwt_service):
@@ -110,24 +119,25 @@ class TestJWTServiceComprehensive:
             jwt_service.verify_token(expired_jwt_token)
     
     @pytest.mark.unit
-    def test_verify_token_revoked(self, jwt_token, jwt_service):
+    def test_verify_token_revoked(self, fresh_jwt_token, jwt_service):
         """Test verification of revoked token."""
         # Revoke token
-        jwt_service.revoke_token(jwt_token)
+        jwt_service.revoke_token(fresh_jwt_token)
         
         # Should raise exception
         with pytest.raises(InvalidTokenError):
-            jwt_service.verify_token(jwt_token)
+            jwt_service.verify_token(fresh_jwt_token)
     
     @pytest.mark.unit
-    def test_hash_password_success(self, jwt_service):
+    def test_hash_password_success(self, real_bcrypt):
         """Test successful password hashing."""
+        jwt_service = JWTService("test-secret-key")
         password = "TestPassword123!"
         hashed = jwt_service.hash_password(password)
         
         assert hashed != password
         assert len(hashed) > 0
-        assert hashed.startswith("$2b$")
+        assert hashed.startswith("$2b$12$")  # production cost factor
         assert len(hashed) == 60  # bcrypt hash length
     
     @pytest.mark.unit
@@ -189,22 +199,22 @@ class TestJWTServiceComprehensive:
         assert token1 != token2
     
     @pytest.mark.unit
-    def test_revoke_token_success(self, jwt_token, jwt_service):
+    def test_revoke_token_success(self, fresh_jwt_token, jwt_service):
         """Test successful token revocation."""
-        result = jwt_service.revoke_token(jwt_token)
+        result = jwt_service.revoke_token(fresh_jwt_token)
         
         assert result is True
-        assert jwt_service.is_token_revoked(jwt_token) is True
+        assert jwt_service.is_token_revoked(fresh_jwt_token) is True
     
     @pytest.mark.unit
-    def test_revoke_token_multiple_times(self, jwt_token, jwt_service):
+    def test_revoke_token_multiple_times(self, fresh_jwt_token, jwt_service):
         """Test revoking the same token multiple times."""
         # First revocation
-        result1 = jwt_service.revoke_token(jwt_token)
+        result1 = jwt_service.revoke_token(fresh_jwt_token)
         assert result1 is True
         
         # Second revocation should still work
-        result2 = jwt_service.revoke_token(jwt_token)
+        result2 = jwt_service.revoke_token(fresh_jwt_token)
         assert result2 is True
     
     @pytest.mark.unit
@@ -213,10 +223,10 @@ class TestJWTServiceComprehensive:
         assert jwt_service.is_token_revoked(jwt_token) is False
     
     @pytest.mark.unit
-    def test_is_token_revoked_true(self, jwt_token, jwt_service):
+    def test_is_token_revoked_true(self, fresh_jwt_token, jwt_service):
         """Test checking revoked token."""
-        jwt_service.revoke_token(jwt_token)
-        assert jwt_service.is_token_revoked(jwt_token) is True
+        jwt_service.revoke_token(fresh_jwt_token)
+        assert jwt_service.is_token_revoked(fresh_jwt_token) is True
     
     @pytest.mark.unit
     def test_jwt_token_value_object_validation(self):
@@ -245,18 +255,26 @@ class TestUserRepositoryComprehensive:
     """Comprehensive unit tests for User Repository"""
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_user_repository_initialization(self, temp_database):
+    async def test_user_repository_initialization(self, temp_database_file):
         """Test user repository initialization."""
-        repo = UserRepository(temp_database)
-        assert repo.database_path == temp_database
+        repo = UserRepository(temp_database_file)
+        assert repo.database_path == temp_database_file
         
         # Verify database was created
         import os
-        assert os.path.exists(temp_database)
+        assert os.path.exists(temp_database_file)
+    
+    @pytest.mark.unit
+    async def test_checkpoint_truncates_wal(self, temp_database_file, user_repository_factory):
+        """Test WAL checkpointing on a file-backed database."""
+        repo = user_repository_factory(temp_database_file)
+        await repo.create_user("test@example.com", "hash", "John", "Doe")
+        
+        busy, log_frames, checkpointed = await repo.checkpoint()
+        assert busy == 0
+        assert log_frames == checkpointed
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_create_user_success(self, user_repository):
         """Test successful user creation."""
         user = await user_repository.create_user(
@@ -275,7 +293,6 @@ class TestUserRepositoryComprehensive:
         assert user.full_name == "John Doe"
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_create_user_duplicate_email(self, user_repository):
         """Test creating user with duplicate email."""
         # Create first user
@@ -286,23 +303,17 @@ class TestUserRepositoryComprehensive:
             await user_repository.create_user("test@example.com", "hash2", "Jane", "Smith")
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_create_user_invalid_data(self, user_repository):
+    @pytest.mark.parametrize("email, first_name, last_name", [
+        ("", "John", "Doe"),  # Empty email
+        ("test@example.com", "", "Doe"),  # Empty first name
+        ("test@example.com", "John", ""),  # Empty last name
+    ])
+    async def test_create_user_invalid_data(self, user_repository, email, first_name, last_name):
         """Test creating user with invalid data."""
-        # Empty email
-        with pytest.raises(ValueError):
-            await user_repository.create_user("", "hash", "John", "Doe")
-        
-        # Empty first name
         with pytest.raises(ValueError):
-            await user_repository.create_user("test@example.com", "hash", "", "Doe")
-        
-        # Empty last name
-        with pytest.raises(ValueError):
-            await user_repository.create_user("test@example.com", "hash", "John", "")
+            await user_repository.create_user(email, "hash", first_name, last_name)
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_get_user_by_email_success(self, user_repository):
         """Test successful user retrieval by email."""
         # Create user
@@ -318,14 +329,12 @@ class TestUserRepositoryComprehensive:
         assert retrieved_user.email == "test@example.com"
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_get_user_by_email_not_found(self, user_repository):
         """Test retrieving non-existent user by email."""
         user = await user_repository.get_user_by_email("nonexistent@example.com")
         assert user is None
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_get_user_by_id_success(self, user_repository):
         """Test successful user retrieval by ID."""
         # Create user
@@ -341,14 +350,12 @@ class TestUserRepositoryComprehensive:
         assert retrieved_user.email == "test@example.com"
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_get_user_by_id_not_found(self, user_repository):
         """Test retrieving non-existent user by ID."""
         user = await user_repository.get_user_by_id(999)
         assert user is None
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_update_user_success(self, user_repository):
         """Test successful user update."""
         # Create user
@@ -369,7 +376,6 @@ class TestUserRepositoryComprehensive:
         assert updated_user.full_name == "Johnny Smith"
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_update_user_not_found(self, user_repository):
         """Test updating non-existent user."""
         updated_user = await user_repository.update_user(
@@ -378,20 +384,19 @@ class TestUserRepositoryComprehensive:
         assert updated_user is None
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_update_user_no_valid_fields(self, user_repository):
-        """Test updating user with no valid fields."""
+        """Test updating user with no valid fields returns it unchanged."""
         # Create user
         user = await user_repository.create_user(
             "test@example.com", "hash", "John", "Doe"
         )
         
-        # Try to update with no valid fields
-        with pytest.raises(ValueError):
-            await user_repository.update_user(user.id, {})
+        # Update with no valid fields
+        unchanged = await user_repository.update_user(user.id, {"unknown": "value"})
+        assert unchanged.id == user.id
+        assert unchanged.first_name == "John"
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_delete_user_success(self, user_repository):
         """Test successful user deletion."""
         # Create user
@@ -404,66 +409,131 @@ class TestUserRepositoryComprehensive:
         assert result is True
         
         # Verify user is deleted
-        deleted_user = await user_repository.get_user_by_id(user.id)
-        assert deleted_user is None
+        assert await _user_exists(user_repository, user.id) is False
+    
+    @pytest.mark.unit
+    async def test_user_lookup_cache_invalidated_on_update(self, user_repository):
+        """Test that cached lookups see updates made through the repository."""
+        user = await user_repository.create_user("test@example.com", "hash", "John", "Doe")
+        assert (await user_repository.get_user_by_id(user.id)).first_name == "John"
+        
+        await user_repository.update_user(user.id, {"email": "new@example.com", "first_name": "Jane"})
+        
+        assert (await user_repository.get_user_by_id(user.id)).first_name == "Jane"
+        assert await user_repository.get_user_by_email("test@example.com") is None
+        assert (await user_repository.get_user_by_email("new@example.com")).id == user.id
+    
+    @pytest.mark.unit
+    async def test_user_lookup_cache_invalidated_on_delete(self, user_repository):
+        """Test that deleted users are not served from the cache."""
+        user = await user_repository.create_user("test@example.com", "hash", "John", "Doe")
+        assert await user_repository.get_user_by_email("test@example.com") is not None
+        
+        await user_repository.delete_user(user.id)
+        
+        assert await user_repository.get_user_by_email("test@example.com") is None
+        assert await user_repository.get_user_by_id(user.id) is None
+    
+    @pytest.mark.unit
+    async def test_user_lookup_cache_returns_copies(self, user_repository):
+        """Test that mutating a looked-up user does not change cached lookups."""
+        user = await user_repository.create_user("test@example.com", "hash", "John", "Doe")
+        user.first_name = "Changed"
+        
+        by_email = await user_repository.get_user_by_email("test@example.com")
+        by_email.first_name = "Changed"
+        
+        assert (await user_repository.get_user_by_email("test@example.com")).first_name == "John"
+        assert (await user_repository.get_user_by_id(user.id)).first_name == "John"
+    
+    @pytest.mark.unit
+    async def test_user_lookup_negative_cache_cleared_on_create(self, user_repository):
+        """Test that a cached "not found" lookup does not hide a new user."""
+        assert await user_repository.get_user_by_email("test@example.com") is None
+        
+        await user_repository.create_user("test@example.com", "hash", "John", "Doe")
+        
+        assert await user_repository.get_user_by_email("test@example.com") is not None
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_delete_user_not_found(self, user_repository):
         """Test deleting non-existent user."""
         result = await user_repository.delete_user(999)
         assert result is False
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_list_users_success(self, user_repository, sample_users):
-        """Test successful user listing."""
+    async def test_user_listing_and_counting(self, user_repository, sample_users, bulk_create_users):
+        """Test user counting, listing and pagination over one data set."""
         # Create users
-        for user in sample_users:
-            await user_repository.create_user(
-                user.email, user.password_hash, user.first_name, user.last_name
-            )
-        
-        # List users
-        users = await user_repository.list_users(limit=2, offset=0)
+        await bulk_create_users(user_repository, sample_users)
         
-        assert len(users) == 2
-        assert all(isinstance(user, User) for user in users)
-    
-    @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_list_users_pagination(self, user_repository, sample_users):
-        """Test user listing with pagination."""
-        # Create users
-        for user in sample_users:
-            await user_repository.create_user(
-                user.email, user.password_hash, user.first_name, user.last_name
-            )
+        # Count users
+        assert await user_repository.count_users() == len(sample_users)
         
-        # Test pagination
+        # List users with pagination
         page1 = await user_repository.list_users(limit=2, offset=0)
         page2 = await user_repository.list_users(limit=2, offset=2)
         
         assert len(page1) == 2
+        assert all(isinstance(user, User) for user in page1)
         assert len(page2) == 1
         assert page1[0].id != page2[0].id
+        
+        # List a page together with the total
+        users, total = await user_repository.list_users_with_count(limit=2, offset=0)
+        assert [user.id for user in users] == [user.id for user in page1]
+        assert total == len(sample_users)
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_count_users_success(self, user_repository, sample_users):
-        """Test successful user counting."""
-        # Create users
-        for user in sample_users:
-            await user_repository.create_user(
-                user.email, user.password_hash, user.first_name, user.last_name
-            )
+    async def test_list_users_with_count_pages(self, user_repository, sample_users, bulk_create_users):
+        """Test that the windowed total counts every user, not just the page."""
+        await bulk_create_users(user_repository, sample_users)
         
-        # Count users
-        count = await user_repository.count_users()
-        assert count == len(sample_users)
+        users, total = await user_repository.list_users_with_count(limit=2, offset=2)
+        assert len(users) == 1
+        assert total == len(sample_users)
+        
+        users, total = await user_repository.list_users_with_count(limit=2, offset=len(sample_users))
+        assert users == []
+        assert total == 0
+    
+    @pytest.mark.unit
+    async def test_list_users_after_cursor(self, user_repository):
+        """Test keyset pagination matches offset pagination."""
+        for i in range(3):
+            await user_repository.create_user(f"user{i}@example.com", "hash", "User", f"Number{i}")
+        
+        page1 = await user_repository.list_users(limit=2, offset=0)
+        last = page1[-1]
+        page2 = await user_repository.list_users_after(last.created_at, last.id, limit=2)
+        
+        expected = await user_repository.list_users(limit=2, offset=2)
+        assert [user.id for user in page2] == [user.id for user in expected]
+        assert len(page2) == 1
+    
+    @pytest.mark.unit
+    async def test_list_users_after_walks_every_user(self, user_repository):
+        """Test that following cursors visits every user once, across timestamp ties."""
+        for i in range(5):
+            await user_repository.create_user(f"user{i}@example.com", "hash", "User", f"Number{i}")
+        # Two users share the newest timestamp, so ties are broken by id
+        conn = await user_repository.connect()
+        await conn.execute("UPDATE users SET created_at = '2030-01-01T00:00:00' WHERE email IN (?, ?)",
+                           ("user0@example.com", "user3@example.com"))
+        
+        walked = await user_repository.list_users(limit=2, offset=0)
+        while True:
+            last = walked[-1]
+            page = await user_repository.list_users_after(last.created_at, last.id, limit=2)
+            if not page:
+                break
+            walked.extend(page)
+        
+        expected = await user_repository.list_users(limit=10, offset=0)
+        assert [user.id for user in walked] == [user.id for user in expected]
+        assert [user.email for user in walked[:2]] == ["user3@example.com", "user0@example.com"]
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_count_users_empty_database(self, user_repository):
         """Test counting users in empty database."""
         count = await user_repository.count_users()
@@ -481,14 +551,16 @@ class TestUserRepositoryComprehensive:
             last_name="Doe"
         )
         assert user.full_name == "John Doe"
-        
-        # Invalid user - empty email
-        with pytest.raises(ValueError):
-            User(1, "", "hash", "John", "Doe")
-        
-        # Invalid user - empty first name
+    
+    @pytest.mark.unit
+    @pytest.mark.parametrize("email, first_name", [
+        ("", "John"),  # Invalid user - empty email
+        ("test@example.com", ""),  # Invalid user - empty first name
+    ])
+    def test_user_entity_validation_invalid(self, email, first_name):
+        """Test User entity validation rejects empty fields."""
         with pytest.raises(ValueError):
-            User(1, "test@example.com", "hash", "", "Doe")
+            User(1, email, "hash", first_name, "Doe")
     
     @pytest.mark.unit
     def test_user_to_dict(self, sample_user):
@@ -505,7 +577,6 @@ class TestAuthenticationServiceComprehensive:
     """Comprehensive unit tests for Authentication Service"""
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_register_user_success(self, auth_service, valid_registration_data):
         """Test successful user registration."""
         result = await auth_service.register_user(**valid_registration_data)
@@ -515,7 +586,6 @@ class TestAuthenticationServiceComprehensive:
         assert result["user"]["full_name"] == "New User"
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_register_user_duplicate_email(self, auth_service, valid_registration_data):
         """Test registering user with duplicate email."""
         # Register first user
@@ -528,7 +598,6 @@ class TestAuthenticationServiceComprehensive:
         assert "already exists" in result["message"]
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_register_user_invalid_data(self, auth_service, invalid_registration_data):
         """Test registering user with invalid data."""
         result = await auth_service.register_user(**invalid_registration_data)
@@ -537,34 +606,25 @@ class TestAuthenticationServiceComprehensive:
         assert "required" in result["message"] or "characters" in result["message"]
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_login_user_success(self, auth_service, valid_registration_data, valid_login_data):
+    async def test_login_user_success(self, auth_service, registered_user):
         """Test successful user login."""
-        # Register user
-        await auth_service.register_user(**valid_registration_data)
-        
         # Login user
-        result = await auth_service.login_user(**valid_login_data)
+        result = await auth_service.login_user(registered_user["email"], registered_user["password"])
         
         assert result["success"] is True
         assert "token" in result
-        assert result["user"]["email"] == valid_login_data["email"]
+        assert result["user"]["email"] == registered_user["email"]
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_login_user_wrong_password(self, auth_service, valid_registration_data):
+    async def test_login_user_wrong_password(self, auth_service, registered_user):
         """Test login with wrong password."""
-        # Register user
-        await auth_service.register_user(**valid_registration_data)
-        
         # Try to login with wrong password
-        result = await auth_service.login_user("test@example.com", "WrongPassword")
+        result = await auth_service.login_user(registered_user["email"], "WrongPassword")
         
         assert result["success"] is False
         assert "Invalid email or password" in result["message"]
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_login_user_nonexistent_user(self, auth_service):
         """Test login with non-existent user."""
         result = await auth_service.login_user("nonexistent@example.com", "password")
@@ -573,21 +633,18 @@ class TestAuthenticationServiceComprehensive:
         assert "Invalid email or password" in result["message"]
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_verify_token_success(self, auth_service, valid_registration_data, valid_login_data):
+    async def test_verify_token_success(self, auth_service, registered_user):
         """Test successful token verification."""
-        # Register and login user
-        await auth_service.register_user(**valid_registration_data)
-        login_result = await auth_service.login_user(**valid_login_data)
+        # Login user
+        login_result = await auth_service.login_user(registered_user["email"], registered_user["password"])
         
         # Verify token
         verify_result = await auth_service.verify_token(login_result["token"])
         
         assert verify_result["success"] is True
-        assert verify_result["user"]["email"] == valid_login_data["email"]
+        assert verify_result["user"]["email"] == registered_user["email"]
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_verify_token_invalid(self, auth_service):
         """Test verifying invalid token."""
         result = await auth_service.verify_token("invalid.token.here")
@@ -596,20 +653,56 @@ class TestAuthenticationServiceComprehensive:
         assert "Invalid token" in result["message"]
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_get_user_profile_success(self, auth_service, valid_registration_data):
-        """Test getting user profile."""
-        # Register user
-        await auth_service.register_user(**valid_registration_data)
+    async def test_verify_token_payload_not_shared(self, auth_service, registered_user):
+        """Test that editing a returned payload does not alter the cached one."""
+        login_result = await auth_service.login_user(registered_user["email"], registered_user["password"])
+        token = login_result["token"]
+        
+        first = await auth_service.verify_token(token)
+        first["token_payload"]["user_id"] = 999
+        
+        second = await auth_service.verify_token(token)
+        assert second["success"] is True
+        assert second["token_payload"]["user_id"] == registered_user["user"]["id"]
+    
+    @pytest.mark.unit
+    async def test_logout_keeps_other_cached_tokens(self, auth_service, registered_user):
+        """Test that logging out evicts only the revoked token's payload."""
+        await auth_service.register_user("other@example.com", "SecurePassword123!", "Jane", "Doe")
+        token = (await auth_service.login_user(registered_user["email"], registered_user["password"]))["token"]
+        other_token = (await auth_service.login_user("other@example.com", "SecurePassword123!"))["token"]
+        await auth_service.verify_token(token)
+        await auth_service.verify_token(other_token)
+        
+        await auth_service.logout_user(token)
+        
+        assert token not in auth_service._payload_cache
+        assert other_token in auth_service._payload_cache
+        assert (await auth_service.verify_token(token))["success"] is False
+        assert (await auth_service.verify_token(other_token))["success"] is True
+    
+    @pytest.mark.unit
+    async def test_verify_and_logout_without_token_cache(self, uncached_auth_service, registered_user):
+        """Test token verification and logout with caching off (the default)."""
+        login_result = await uncached_auth_service.login_user(registered_user["email"], registered_user["password"])
+        token = login_result["token"]
+        
+        assert (await uncached_auth_service.verify_token(token))["success"] is True
+        assert len(uncached_auth_service._payload_cache) == 0
         
+        await uncached_auth_service.logout_user(token)
+        assert (await uncached_auth_service.verify_token(token))["success"] is False
+    
+    @pytest.mark.unit
+    async def test_get_user_profile_success(self, auth_service, registered_user):
+        """Test getting user profile."""
         # Get user profile
-        result = await auth_service.get_user_profile(1)
+        result = await auth_service.get_user_profile(registered_user["user"]["id"])
         
         assert result["success"] is True
-        assert result["user"]["email"] == valid_registration_data["email"]
+        assert result["user"]["email"] == registered_user["email"]
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_get_user_profile_not_found(self, auth_service):
         """Test getting profile of non-existent user."""
         result = await auth_service.get_user_profile(999)
@@ -618,15 +711,11 @@ class TestAuthenticationServiceComprehensive:
         assert "not found" in result["message"]
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_update_user_profile_success(self, auth_service, valid_registration_data):
+    async def test_update_user_profile_success(self, auth_service, registered_user):
         """Test updating user profile."""
-        # Register user
-        await auth_service.register_user(**valid_registration_data)
-        
         # Update profile
         result = await auth_service.update_user_profile(
-            1, {"first_name": "Updated", "last_name": "Name"}
+            registered_user["user"]["id"], {"first_name": "Updated", "last_name": "Name"}
         )
         
         assert result["success"] is True
@@ -634,54 +723,83 @@ class TestAuthenticationServiceComprehensive:
         assert result["user"]["last_name"] == "Name"
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_update_user_profile_no_valid_fields(self, auth_service, valid_registration_data):
+    async def test_update_user_profile_no_valid_fields(self, auth_service, registered_user):
         """Test updating user profile with no valid fields."""
-        # Register user
-        await auth_service.register_user(**valid_registration_data)
-        
         # Try to update with no valid fields
-        result = await auth_service.update_user_profile(1, {})
+        result = await auth_service.update_user_profile(registered_user["user"]["id"], {})
         
         assert result["success"] is False
         assert "No valid fields" in result["message"]
 
 
+class TestBcryptIntegration:
+    """Authentication flow tests that use real bcrypt hashing"""
+    
+    @pytest.mark.unit
+    @pytest.mark.bcrypt
+    async def test_register_user_stores_bcrypt_hash(self, bcrypt_auth_service, user_repository):
+        """Test that registration stores a bcrypt hash, not the password."""
+        await bcrypt_auth_service.register_user("bcrypt@example.com", "SecurePassword123!", "John", "Doe")
+        
+        user = await user_repository.get_user_by_email("bcrypt@example.com")
+        assert user.password_hash.startswith("$2b$")
+        assert user.password_hash != "SecurePassword123!"
+        assert bcrypt.checkpw(b"SecurePassword123!", user.password_hash.encode())
+    
+    @pytest.mark.unit
+    @pytest.mark.bcrypt
+    async def test_login_user_with_bcrypt_hash(self, bcrypt_auth_service):
+        """Test login against a bcrypt-hashed password."""
+        await bcrypt_auth_service.register_user("bcrypt@example.com", "SecurePassword123!", "John", "Doe")
+        
+        result = await bcrypt_auth_service.login_user("bcrypt@example.com", "SecurePassword123!")
+        assert result["success"] is True
+    
+    @pytest.mark.unit
+    @pytest.mark.bcrypt
+    async def test_login_user_wrong_password_with_bcrypt_hash(self, bcrypt_auth_service):
+        """Test wrong-password rejection against a bcrypt-hashed password."""
+        await bcrypt_auth_service.register_user("bcrypt@example.com", "SecurePassword123!", "John", "Doe")
+        
+        result = await bcrypt_auth_service.login_user("bcrypt@example.com", "WrongPassword")
+        assert result["success"] is False
+
+
 # Test utilities and helpers
 class TestUtilities:
     """Test utility functions"""
     
+    @pytest.fixture(scope="class")
+    def util_jwt_service(self):
+        """JWT service shared by the utility edge-case tests."""
+        return JWTService("secret")
+    
     @pytest.mark.unit
-    def test_jwt_token_creation_edge_cases(self):
+    def test_jwt_token_creation_edge_cases(self, util_jwt_service):
         """Test JWT token creation with edge cases."""
         # Test with very long email
         long_email = "a" * 100 + "@example.com"
-        service = JWTService("secret")
-        token = service.create_token(1, long_email, "customer")
+        token = util_jwt_service.create_token(1, long_email, "customer")
         assert isinstance(token, JWTToken)
         
         # Test with special characters in role
-        service = JWTService("secret")
-        token = service.create_token(1, "test@example.com", "admin-special")
+        token = util_jwt_service.create_token(1, "test@example.com", "admin-special")
         assert isinstance(token, JWTToken)
     
     @pytest.mark.unit
-    def test_password_hashing_edge_cases(self):
+    def test_password_hashing_edge_cases(self, util_jwt_service):
         """Test password hashing with edge cases."""
-        service = JWTService("secret")
-        
-        # Test with very long password
-        long_password = "A" * 1000
-        hashed = service.hash_password(long_password)
+        # Test with a password at bcrypt's 72-byte limit (longer input is truncated)
+        long_password = "A" * 72
+        hashed = util_jwt_service.hash_password(long_password)
         assert len(hashed) > 0
         
         # Test with special characters
         special_password = "!@#$%^&*()_+-=[]{}|;':\",./<>?"
-        hashed = service.hash_password(special_password)
+        hashed = util_jwt_service.hash_password(special_password)
         assert len(hashed) > 0
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_user_repository_edge_cases(self, user_repository):
         """Test user repository with edge cases."""
         # Test with very long email
@@ -9,13 +9,51 @@ Features:
 - Clean Architecture separation of concerns
 - Proper error handling and validation
 - Database schema management
+- A single long-lived aiosqlite connection shared by all operations
+- TTL caching of user lookups by email and ID
 """
 
 import sqlite3
 import asyncio
-from typing import Optional, List, Dict, Any
+import logging
+import aiosqlite
+from cachetools import TTLCache
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=4096)
+def _parse_timestamp(value: str) -> datetime:
+    """Parse a stored created_at value; re-listed rows reuse the parsed datetime"""
+    return datetime.fromisoformat(value)
+
+
+# SQL is kept in module constants so every call reuses the same string and
+# hits sqlite3's prepared-statement cache. Column order matches _user_from_row.
+_USER_COLUMNS = "id, email, password_hash, first_name, last_name, created_at"
+# created_at is always written as datetime.isoformat() (local time, 'T'
+# separator), never the UTC CURRENT_TIMESTAMP default, so ORDER BY created_at
+# and the keyset comparison below order rows by plain string comparison
+_SQL_INSERT = (
+    "INSERT INTO users (email, password_hash, first_name, last_name, created_at) VALUES (?, ?, ?, ?, ?) "
+    "ON CONFLICT(email) DO NOTHING RETURNING id"
+)
+_SQL_GET_BY_EMAIL = f"SELECT {_USER_COLUMNS} FROM users WHERE email = ?"
+_SQL_GET_BY_ID = f"SELECT {_USER_COLUMNS} FROM users WHERE id = ?"
+_SQL_LIST = f"SELECT {_USER_COLUMNS} FROM users ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?"
+_SQL_LIST_AFTER = (
+    f"SELECT {_USER_COLUMNS} FROM users WHERE (created_at, id) < (?, ?) "
+    "ORDER BY created_at DESC, id DESC LIMIT ?"
+)
+_SQL_LIST_WITH_COUNT = (
+    f"SELECT {_USER_COLUMNS}, COUNT(*) OVER () FROM users ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?"
+)
+_SQL_COUNT = "SELECT user_count FROM user_stats WHERE id = 1"
+_SQL_DELETE = "DELETE FROM users WHERE id = ? RETURNING email"
 
 
 @dataclass
@@ -90,22 +128,40 @@ class UserRepository:
     
     This repository handles all database operations for users
     following Clean Architecture principles.
+    
+    All statements run on the aiosqlite connection's worker thread, so
+    queries never block the event loop and writes are serialized through
+    a single writer.
     """
     
-    def __init__(self, database_path: str = "example_users.db"):
+    # Columns update_user is allowed to change
+    _UPDATABLE_FIELDS = frozenset({'email', 'password_hash', 'first_name', 'last_name'})
+    
+    def __init__(self, database_path: str = "example_users.db",
+                 cache_ttl: float = 60, negative_cache_ttl: float = 5):
         """
         Initialize user repository.
         
         Args:
             database_path: Path to SQLite database file
+            cache_ttl: Seconds a looked-up user stays cached
+            negative_cache_ttl: Seconds a "not found" lookup stays cached
         """
         self.database_path = database_path
+        # "file:" paths are SQLite URIs, e.g. a shared in-memory database
+        self._uri = database_path.startswith("file:")
+        self._conn: Optional[aiosqlite.Connection] = None
+        self._connect_lock = asyncio.Lock()
+        self._email_cache = TTLCache(maxsize=10_000, ttl=cache_ttl)
+        self._id_cache = TTLCache(maxsize=10_000, ttl=cache_ttl)
+        self._missing_emails = TTLCache(maxsize=10_000, ttl=negative_cache_ttl)
+        self._missing_ids = TTLCache(maxsize=10_000, ttl=negative_cache_ttl)
         self._ensure_database_exists()
     
     def _ensure_database_exists(self):
         """Ensure database and tables exist"""
         try:
-            conn = sqlite3.connect(self.database_path)
+            conn = sqlite3.connect(self.database_path, uri=self._uri)
             cursor = conn.cursor()
             
             # Create users table with proper schema
@@ -122,24 +178,131 @@ class UserRepository:
             
             # Create indexes for performance
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_users_email ON users(email)')
+            # Indexes carry the rowid (id), so this also serves ORDER BY created_at, id
+            # and keyset pagination on (created_at, id) as a single index range scan
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_users_created_at ON users(created_at)')
             
+            # Keep the user count alongside writes so counting is O(1)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS user_stats (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    user_count INTEGER NOT NULL DEFAULT 0
+                )
+            ''')
+            cursor.execute('INSERT OR IGNORE INTO user_stats (id, user_count) SELECT 1, COUNT(*) FROM users')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS users_ai AFTER INSERT ON users
+                BEGIN
+                    UPDATE user_stats SET user_count = user_count + 1 WHERE id = 1;
+                END
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS users_ad AFTER DELETE ON users
+                BEGIN
+                    UPDATE user_stats SET user_count = user_count - 1 WHERE id = 1;
+                END
+            ''')
+            
             conn.commit()
             conn.close()
             
         except Exception as e:
             raise UserRepositoryConnectionError(f"Failed to initialize database: {e}")
     
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get database connection with proper configuration"""
+    async def connect(self) -> aiosqlite.Connection:
+        """
+        Open the shared database connection if it is not open yet.
+        
+        The connection is configured once and reused by every operation,
+        so SQLite keeps its page cache between calls. It runs in autocommit
+        mode: each statement is its own transaction, so coroutines that
+        interleave on the shared connection never end up in one transaction.
+        Every write is a single statement, which takes SQLite's write lock
+        before it reads anything (as BEGIN IMMEDIATE would), so there is no
+        read-to-write lock upgrade to fail with SQLITE_BUSY.
+        
+        Returns:
+            The open aiosqlite connection
+            
+        Raises:
+            UserRepositoryConnectionError: If the connection cannot be opened
+        """
+        if self._conn is not None:
+            return self._conn
+        
+        # Concurrent first calls must not each open (and leak) a connection
+        async with self._connect_lock:
+            if self._conn is None:
+                try:
+                    conn = await aiosqlite.connect(self.database_path, uri=self._uri, isolation_level=None)
+                    await conn.execute("PRAGMA foreign_keys = ON")
+                    await conn.execute("PRAGMA journal_mode = WAL")
+                    await conn.execute("PRAGMA synchronous = NORMAL")
+                    # Wait for competing writers instead of failing with "database is locked"
+                    await conn.execute("PRAGMA busy_timeout = 5000")
+                    await conn.execute("PRAGMA wal_autocheckpoint = 1000")
+                    await conn.execute("PRAGMA mmap_size = 268435456")
+                    await conn.execute("PRAGMA cache_size = -65536")
+                    await conn.execute("PRAGMA temp_store = MEMORY")
+                    self._conn = conn
+                except Exception as e:
+                    raise UserRepositoryConnectionError(f"Failed to connect to database: {e}")
+        return self._conn
+    
+    async def checkpoint(self) -> tuple:
+        """
+        Checkpoint the WAL into the database file and truncate it.
+        
+        Returns:
+            SQLite's (busy, log_frames, checkpointed_frames) result
+            
+        Raises:
+            UserRepositoryError: If the checkpoint fails
+        """
         try:
-            conn = sqlite3.connect(self.database_path)
-            conn.execute("PRAGMA foreign_keys = ON")
-            conn.execute("PRAGMA journal_mode = WAL")
-            conn.execute("PRAGMA synchronous = NORMAL")
-            return conn
+            conn = await self.connect()
+            rows = await conn.execute_fetchall("PRAGMA wal_checkpoint(TRUNCATE)")
+            return tuple(rows[0])
         except Exception as e:
-            raise UserRepositoryConnectionError(f"Failed to connect to database: {e}")
+            raise UserRepositoryError(f"Failed to checkpoint database: {e}")
+    
+    async def close(self) -> None:
+        """Close the shared database connection."""
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            await conn.close()
+    
+    def _cache_user(self, user: User) -> None:
+        """Cache a user under both its email and its ID"""
+        # User is mutable: keep a private copy so callers can't alter the cache
+        cached = replace(user)
+        self._email_cache[user.email] = cached
+        self._id_cache[user.id] = cached
+    
+    def _evict_user(self, user_id: int, email: Optional[str] = None) -> None:
+        """Drop a user from the lookup caches after it changes"""
+        cached = self._id_cache.pop(user_id, None)
+        if email is None and cached is not None:
+            email = cached.email
+        
+        if email is not None:
+            self._email_cache.pop(email, None)
+        else:
+            # Old email unknown: drop any email entry that points at this user
+            for key in [key for key, user in self._email_cache.items() if user.id == user_id]:
+                self._email_cache.pop(key, None)
+    
+    def clear_cache(self) -> None:
+        """
+        Drop all cached lookups.
+        
+        Call this after writing to the database without going through
+        the repository.
+        """
+        self._email_cache.clear()
+        self._id_cache.clear()
+        self._missing_emails.clear()
+        self._missing_ids.clear()
     
     def _user_from_row(self, row: tuple) -> User:
         """Convert database row to User entity"""
@@ -150,7 +313,7 @@ class UserRepository:
                 password_hash=row[2],
                 first_name=row[3],
                 last_name=row[4],
-                created_at=datetime.fromisoformat(row[5]) if row[5] else None
+                created_at=_parse_timestamp(row[5]) if row[5] else None
             )
         except Exception as e:
             raise UserRepositoryError(f"Failed to convert row to User: {e}")
@@ -173,24 +336,20 @@ class UserRepository:
             UserRepositoryError: If creation fails
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            conn = await self.connect()
             
-            # Check if user already exists
-            cursor.execute('SELECT id FROM users WHERE email = ?', (email,))
-            if cursor.fetchone():
-                conn.close()
+            # Insert new user; the UNIQUE email index rejects duplicates atomically
+            created_at = datetime.now()
+            rows = await conn.execute_fetchall(
+                _SQL_INSERT, (email, password_hash, first_name, last_name, created_at.isoformat())
+            )
+            if not rows:
                 raise UserAlreadyExistsError(f"User with email {email} already exists")
+            user_id = rows[0][0]
             
-            # Insert new user
-            cursor.execute('''
-                INSERT INTO users (email, password_hash, first_name, last_name, created_at)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (email, password_hash, first_name, last_name, datetime.now().isoformat()))
-            
-            user_id = cursor.lastrowid
-            conn.commit()
-            conn.close()
+            # Forget earlier "not found" lookups for the new user
+            self._missing_emails.pop(email, None)
+            self._missing_ids.pop(user_id, None)
             
             # Return created user
             return User(
@@ -199,7 +358,7 @@ class UserRepository:
                 password_hash=password_hash,
                 first_name=first_name,
                 last_name=last_name,
-                created_at=datetime.now()
+                created_at=created_at
             )
             
         except UserAlreadyExistsError:
@@ -220,18 +379,23 @@ class UserRepository:
         Raises:
             UserRepositoryError: If query fails
         """
+        cached = self._email_cache.get(email)
+        if cached is not None:
+            return replace(cached)
+        if email in self._missing_emails:
+            return None
+        
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('SELECT * FROM users WHERE email = ?', (email,))
-            row = cursor.fetchone()
-            conn.close()
+            conn = await self.connect()
+            rows = await conn.execute_fetchall(_SQL_GET_BY_EMAIL, (email,))
             
-            if not row:
+            if not rows:
+                self._missing_emails[email] = True
                 return None
             
-            return self._user_from_row(row)
+            user = self._user_from_row(rows[0])
+            self._cache_user(user)
+            return user
             
         except Exception as e:
             raise UserRepositoryError(f"Failed to get user by email: {e}")
@@ -249,18 +413,23 @@ class UserRepository:
         Raises:
             UserRepositoryError: If query fails
         """
+        cached = self._id_cache.get(user_id)
+        if cached is not None:
+            return replace(cached)
+        if user_id in self._missing_ids:
+            return None
+        
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('SELECT * FROM users WHERE id = ?', (user_id,))
-            row = cursor.fetchone()
-            conn.close()
+            conn = await self.connect()
+            rows = await conn.execute_fetchall(_SQL_GET_BY_ID, (user_id,))
             
-            if not row:
+            if not rows:
+                self._missing_ids[user_id] = True
                 return None
             
-            return self._user_from_row(row)
+            user = self._user_from_row(rows[0])
+            self._cache_user(user)
+            return user
             
         except Exception as e:
             raise UserRepositoryError(f"Failed to get user by ID: {e}")
@@ -274,47 +443,44 @@ class UserRepository:
             updates: Dictionary of fields to update
             
         Returns:
-            Updated user entity if found, None otherwise
+            Updated user entity if found, None otherwise. When no valid
+            fields are given, the current user is returned unchanged.
             
         Raises:
             UserRepositoryError: If update fails
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            # Check if user exists
-            cursor.execute('SELECT id FROM users WHERE id = ?', (user_id,))
-            if not cursor.fetchone():
-                conn.close()
-                return None
-            
             # Build update query
-            allowed_fields = ['email', 'password_hash', 'first_name', 'last_name']
             update_fields = []
             values = []
             
             for field, value in updates.items():
-                if field in allowed_fields and value is not None:
+                if field in self._UPDATABLE_FIELDS and value is not None:
                     update_fields.append(f"{field} = ?")
                     values.append(value)
             
             if not update_fields:
-                conn.close()
-                raise ValueError("No valid fields to update")
+                return await self.get_user_by_id(user_id)
             
             # Add user_id to values
             values.append(user_id)
             
-            # Execute update
-            query = f"UPDATE users SET {', '.join(update_fields)} WHERE id = ?"
-            cursor.execute(query, values)
-            
-            conn.commit()
-            conn.close()
+            # Execute update; an empty result means the user does not exist
+            conn = await self.connect()
+            query = (
+                f"UPDATE users SET {', '.join(update_fields)} WHERE id = ? "
+                f"RETURNING {_USER_COLUMNS}"
+            )
+            rows = await conn.execute_fetchall(query, values)
+            if not rows:
+                return None
             
             # Return updated user
-            return await self.get_user_by_id(user_id)
+            user = self._user_from_row(rows[0])
+            self._evict_user(user_id)
+            self._missing_emails.pop(user.email, None)
+            self._cache_user(user)
+            return user
             
         except Exception as e:
             raise UserRepositoryError(f"Failed to update user: {e}")
@@ -333,15 +499,13 @@ class UserRepository:
             UserRepositoryError: If deletion fails
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            conn = await self.connect()
+            rows = await conn.execute_fetchall(_SQL_DELETE, (user_id,))
+            if not rows:
+                return False
             
-            cursor.execute('DELETE FROM users WHERE id = ?', (user_id,))
-            rows_affected = cursor.rowcount
-            conn.commit()
-            conn.close()
-            
-            return rows_affected > 0
+            self._evict_user(user_id, rows[0][0])
+            return True
             
         except Exception as e:
             raise UserRepositoryError(f"Failed to delete user: {e}")
@@ -361,23 +525,72 @@ class UserRepository:
             UserRepositoryError: If query fails
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            conn = await self.connect()
+            rows = await conn.execute_fetchall(_SQL_LIST, (limit, offset))
             
-            cursor.execute('''
-                SELECT * FROM users 
-                ORDER BY created_at DESC 
-                LIMIT ? OFFSET ?
-            ''', (limit, offset))
+            return [self._user_from_row(row) for row in rows]
             
-            rows = cursor.fetchall()
-            conn.close()
+        except Exception as e:
+            raise UserRepositoryError(f"Failed to list users: {e}")
+    
+    async def list_users_after(self, cursor_created_at: datetime, cursor_id: int, limit: int = 50) -> List[User]:
+        """
+        List the users that come after a cursor, newest first.
+        
+        Unlike offset pagination, the cost of a page does not grow with how
+        deep it is. Pass the created_at and id of the last user on the
+        previous page as the cursor.
+        
+        Args:
+            cursor_created_at: created_at of the last user already seen
+            cursor_id: ID of the last user already seen
+            limit: Maximum number of users to return
+            
+        Returns:
+            List of user entities
+            
+        Raises:
+            UserRepositoryError: If query fails
+        """
+        try:
+            conn = await self.connect()
+            rows = await conn.execute_fetchall(
+                _SQL_LIST_AFTER, (cursor_created_at.isoformat(), cursor_id, limit)
+            )
             
             return [self._user_from_row(row) for row in rows]
             
         except Exception as e:
             raise UserRepositoryError(f"Failed to list users: {e}")
     
+    async def list_users_with_count(self, limit: int = 50, offset: int = 0) -> Tuple[List[User], int]:
+        """
+        List a page of users together with the total number of users.
+        
+        Prefer this over calling list_users and count_users back to back:
+        the total is computed during the same scan, in one statement.
+        
+        Args:
+            limit: Maximum number of users to return
+            offset: Number of users to skip
+            
+        Returns:
+            Tuple of (users on the page, total number of users). The total
+            is 0 when the page is empty.
+            
+        Raises:
+            UserRepositoryError: If query fails
+        """
+        try:
+            conn = await self.connect()
+            rows = await conn.execute_fetchall(_SQL_LIST_WITH_COUNT, (limit, offset))
+            
+            total = rows[0][-1] if rows else 0
+            return [self._user_from_row(row) for row in rows], total
+            
+        except Exception as e:
+            raise UserRepositoryError(f"Failed to list users: {e}")
+    
     async def count_users(self) -> int:
         """
         Count total number of users.
@@ -389,19 +602,35 @@ class UserRepository:
             UserRepositoryError: If count fails
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            conn = await self.connect()
+            rows = await conn.execute_fetchall(_SQL_COUNT)
             
-            cursor.execute('SELECT COUNT(*) FROM users')
-            result = cursor.fetchone()[0]
-            conn.close()
-            
-            return result
+            return rows[0][0]
             
         except Exception as e:
             raise UserRepositoryError(f"Failed to count users: {e}")
 
 
+async def periodic_checkpoint(repository: UserRepository, interval: float = 60) -> None:
+    """
+    Checkpoint the repository's WAL every ``interval`` seconds until cancelled.
+    
+    Run it as a background task next to the application so the WAL file
+    stays bounded even when readers keep automatic checkpoints from finishing.
+    
+    Args:
+        repository: User repository to checkpoint
+        interval: Seconds between checkpoints
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            busy, log_frames, checkpointed = await repository.checkpoint()
+            logger.info(f"WAL checkpoint: busy={busy} log={log_frames} checkpointed={checkpointed}")
+        except UserRepositoryError as e:
+            logger.warning(f"WAL checkpoint failed: {e}")
+
+
 # Factory function
 def create_user_repository(database_path: str = "example_users.db") -> UserRepository:
     """
@@ -457,6 +686,8 @@ if __name__ == "__main__":
         # Example: Count users
         count = await user_repo.count_users()
         print(f"User count: {count}")
+        
+        await user_repo.close()
     
     # Run example
     asyncio.run(main())
@@ -19,10 +19,9 @@ def run_command(command, description):
     print(f"{'='*60}")
     
     try:
-        result = subprocess.run(command, shell=True, capture_output=True, text=True)
-        print(result.stdout)
-        if result.stderr:
-            print("STDERR:", result.stderr)
+        # Inherit stdout/stderr so output streams live instead of being buffered
+        sys.stdout.flush()
+        result = subprocess.run(command, shell=True, text=True)
         return result.returncode == 0
     except Exception as e:
         print(f"Error running command: {e}")
@@ -44,31 +43,10 @@ def main():
         print("❌ Failed to install dependencies")
         return 1
     
-    # Run unit tests
-    print("\n🔬 Running unit tests...")
-    unit_success = run_command(
-        "pytest tests/unit/ -v --cov=src --cov-report=term-missing --cov-report=html:htmlcov/unit",
-        "Unit tests with coverage"
-    )
-    
-    # Run integration tests
-    print("\n🔗 Running integration tests...")
-    integration_success = run_command(
-        "pytest tests/integration/ -v --cov=src --cov-report=term-missing --cov-report=html:htmlcov/integration",
-        "Integration tests with coverage"
-    )
-    
-    # Run E2E tests
-    print("\n🌐 Running E2E tests...")
-    e2e_success = run_command(
-        "pytest tests/e2e/ -v --cov=src --cov-report=term-missing --cov-report=html:htmlcov/e2e",
-        "E2E tests with coverage"
-    )
-    
-    # Run all tests with comprehensive coverage
+    # Run all tests once, in parallel, with comprehensive coverage
     print("\n📊 Running comprehensive test suite...")
     all_tests_success = run_command(
-        "pytest tests/ -v --cov=src --cov-report=term-missing --cov-report=html:htmlcov/all --cov-report=xml:coverage.xml --cov-fail-under=85",
+        "pytest tests/ -v -n auto --dist loadfile -o log_cli=true --cov=src --cov-report=term-missing --cov-report=html:htmlcov/all --cov-report=xml:coverage.xml --cov-fail-under=85 --junit-xml=reports/all.xml",
         "All tests with comprehensive coverage"
     )
     
@@ -79,44 +57,11 @@ def main():
         "Coverage report"
     )
     
-    # Run specific test categories with markers
-    print("\n🏷️ Running tests by category...")
-    
-    # Unit tests only
-    run_command("pytest -m unit -v", "Unit tests only")
-    
-    # Integration tests only
-    run_command("pytest -m integration -v", "Integration tests only")
-    
-    # E2E tests only
-    run_command("pytest -m e2e -v", "E2E tests only")
-    
-    # Authentication tests
-    run_command("pytest -m auth -v", "Authentication tests only")
-    
-    # Products tests
-    run_command("pytest -m products -v", "Products tests only")
-    
     # Summary
     print("\n" + "="*60)
     print("📋 TEST SUMMARY")
     print("="*60)
     
-    if unit_success:
-        print("✅ Unit tests: PASSED")
-    else:
-        print("❌ Unit tests: FAILED")
-    
-    if integration_success:
-        print("✅ Integration tests: PASSED")
-    else:
-        print("❌ Integration tests: FAILED")
-    
-    if e2e_success:
-        print("✅ E2E tests: PASSED")
-    else:
-        print("❌ E2E tests: FAILED")
-    
     if all_tests_success:
         print("✅ All tests: PASSED")
         print("🎉 Coverage target (85%) achieved!")
@@ -124,16 +69,11 @@ def main():
         print("❌ Some tests failed or coverage target not met")
     
     print(f"\n📁 Coverage reports generated in:")
-    print(f"   - htmlcov/unit/ (Unit tests)")
-    print(f"   - htmlcov/integration/ (Integration tests)")
-    print(f"   - htmlcov/e2e/ (E2E tests)")
     print(f"   - htmlcov/all/ (All tests)")
     print(f"   - coverage.xml (XML format)")
+    print(f"   - reports/all.xml (JUnit results for per-category breakdowns)")
     
     print(f"\n🔍 To view HTML coverage reports:")
-    print(f"   - Unit: open htmlcov/unit/index.html")
-    print(f"   - Integration: open htmlcov/integration/index.html")
-    print(f"   - E2E: open htmlcov/e2e/index.html")
     print(f"   - All: open htmlcov/all/index.html")
     
     return 0 if all_tests_success else 1
@@ -3,10 +3,28 @@
 Script para poblar la base de datos con datos de prueba
 """
 
+import os
 import sqlite3
 import json
 from datetime import datetime
 
+try:
+    import orjson
+
+    def dumps(value):
+        return orjson.dumps(value).decode()
+except ImportError:  # pragma: no cover - orjson es opcional para este script
+    dumps = json.dumps
+
+# PRAGMAs para cargas masivas: el seed se puede repetir, así que se prescinde
+# del fsync por commit (SEED_SYNCHRONOUS=NORMAL para desactivarlo)
+SEED_PRAGMAS = f"""
+    PRAGMA journal_mode = WAL;
+    PRAGMA synchronous = {os.getenv("SEED_SYNCHRONOUS", "OFF")};
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -100000;
+"""
+
 def create_sample_products():
     """Crear productos de ejemplo"""
     products = [
@@ -133,10 +151,29 @@ def create_sample_products():
     ]
     return products
 
+def iter_product_rows(products):
+    """Generar las filas de productos ya listas para el INSERT, una a una"""
+    for product in products:
+        yield (
+            product['name'],
+            product['description'],
+            product['price'],
+            product['compare_at_price'],
+            product['sku'],
+            product['category'],
+            product['brand'],
+            dumps(product['inventory']),
+            dumps(product['images']),
+            dumps(product['tags']),
+            product['featured']
+        )
+
 def seed_database():
     """Poblar la base de datos con datos de prueba"""
-    conn = sqlite3.connect('ecommerce_clean.db')
+    # Autocommit: las transacciones se abren y cierran explícitamente
+    conn = sqlite3.connect('ecommerce_clean.db', isolation_level=None)
     cursor = conn.cursor()
+    cursor.executescript(SEED_PRAGMAS)
     
     # Crear tabla de productos si no existe
     cursor.execute('''
@@ -158,30 +195,16 @@ def seed_database():
         )
     ''')
     
-    # Insertar productos de ejemplo
-    products = create_sample_products()
-    
-    for product in products:
-        cursor.execute('''
-            INSERT OR REPLACE INTO products 
-            (name, description, price, compare_at_price, sku, category, brand, 
-             inventory, images, tags, featured)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            product['name'],
-            product['description'],
-            product['price'],
-            product['compare_at_price'],
-            product['sku'],
-            product['category'],
-            product['brand'],
-            json.dumps(product['inventory']),
-            json.dumps(product['images']),
-            json.dumps(product['tags']),
-            product['featured']
-        ))
+    # Insertar productos de ejemplo en una sola transacción
+    cursor.execute("BEGIN")
+    cursor.executemany('''
+        INSERT OR REPLACE INTO products 
+        (name, description, price, compare_at_price, sku, category, brand, 
+         inventory, images, tags, featured)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', iter_product_rows(create_sample_products()))
     
-    conn.commit()
+    cursor.execute("COMMIT")
     conn.close()
     print("✅ Base de datos poblada con productos de ejemplo")
 
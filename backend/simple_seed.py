@@ -3,13 +3,25 @@
 Script simple para poblar la base de datos
 """
 
+import os
 import sqlite3
 import json
 
+# PRAGMAs para cargas masivas: el seed se puede repetir, así que se prescinde
+# del fsync por commit (SEED_SYNCHRONOUS=NORMAL para desactivarlo)
+SEED_PRAGMAS = f"""
+    PRAGMA journal_mode = WAL;
+    PRAGMA synchronous = {os.getenv("SEED_SYNCHRONOUS", "OFF")};
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -100000;
+"""
+
 def seed_simple_products():
     """Crear productos simples"""
-    conn = sqlite3.connect('ecommerce_clean.db')
+    # Autocommit: las transacciones se abren y cierran explícitamente
+    conn = sqlite3.connect('ecommerce_clean.db', isolation_level=None)
     cursor = conn.cursor()
+    cursor.executescript(SEED_PRAGMAS)
     
     # Productos simples
     products = [
@@ -20,21 +32,22 @@ def seed_simple_products():
         ("Nike Air Max 270", "Zapatillas deportivas", 150.00, "Calzado", "Nike", 100)
     ]
     
-    for name, description, price, category, brand, quantity in products:
-        try:
-            cursor.execute('''
-                INSERT INTO products (name, description, price, category, brand, inventory_quantity)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (name, description, price, category, brand, quantity))
-        except sqlite3.OperationalError as e:
-            print(f"Error con {name}: {e}")
-            # Intentar con estructura mínima
-            cursor.execute('''
-                INSERT INTO products (name, price)
-                VALUES (?, ?)
-            ''', (name, price))
+    cursor.execute("BEGIN")
+    try:
+        cursor.executemany('''
+            INSERT INTO products (name, description, price, category, brand, inventory_quantity)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', products)
+    except sqlite3.OperationalError as e:
+        # El esquema es el mismo para todas las filas: si falla, falla para todas
+        print(f"Error con el esquema de products: {e}")
+        # Intentar con estructura mínima
+        cursor.executemany('''
+            INSERT INTO products (name, price)
+            VALUES (?, ?)
+        ''', [(name, price) for name, _, price, *_ in products])
     
-    conn.commit()
+    cursor.execute("COMMIT")
     conn.close()
     print("✅ Productos agregados a la base de datos")
 
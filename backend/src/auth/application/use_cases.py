@@ -1,13 +1,20 @@
 """
 Auth Use Cases
 """
+import asyncio
+import time
 from typing import Optional, Dict, Any
+from uuid import uuid4
 from src.auth.domain.entities import User
-from src.auth.domain.value_objects import UserId, Email
+from src.auth.domain.value_objects import UserId, cached_email, cached_user_id
 from src.auth.infrastructure.jwt_service import JWTService
 from src.auth.infrastructure.password_service import PasswordService
 from src.auth.infrastructure.user_repository import SQLiteUserRepository
 
+# Real bcrypt hash (cost 12, same as PasswordService) of a throwaway password,
+# verified against when the email is unknown so that case costs a full bcrypt too
+_DUMMY_PASSWORD_HASH = "$2b$12$SM.RXhkBK5ijatD7QdE0teQnsbWqQBiHZSL0mQEeAo0Bjx/f0CAJC"
+
 class RegisterUserUseCase:
     """Register new user use case"""
     
@@ -15,24 +22,23 @@ class RegisterUserUseCase:
         self.user_repository = user_repository
         self.password_service = password_service
     
-    def execute(self, email: str, password: str, first_name: str = None, last_name: str = None) -> Dict[str, Any]:
+    async def execute(self, email: str, password: str, first_name: str = None, last_name: str = None) -> Dict[str, Any]:
         """Register a new user"""
-        # Validate password strength
+        # Cheap validation first: email format, then password strength
+        email_obj = cached_email(email)
         if not self.password_service.is_password_strong(password):
             raise ValueError("Password does not meet security requirements")
         
-        # Check if user already exists
-        email_obj = Email(email)
+        # Then the lookup, so bcrypt only runs for emails that are free
         existing_user = self.user_repository.get_user_by_email(email_obj)
         if existing_user:
             raise ValueError("User with this email already exists")
         
-        # Hash password
-        hashed_password = self.password_service.hash_password(password)
+        # Hash password off the event loop (bcrypt releases the GIL)
+        hashed_password = await asyncio.to_thread(self.password_service.hash_password, password)
         
         # Create user
-        import uuid
-        user_id = UserId(f"user_{uuid.uuid4().hex[:8]}")
+        user_id = UserId(f"user_{uuid4().hex[:8]}")
         user = User(
             id=user_id,
             email=email_obj,
@@ -58,20 +64,25 @@ class LoginUserUseCase:
         self.password_service = password_service
         self.jwt_service = jwt_service
     
-    def execute(self, email: str, password: str) -> Dict[str, Any]:
+    async def execute(self, email: str, password: str) -> Dict[str, Any]:
         """Login user"""
         # Get user by email
-        email_obj = Email(email)
+        email_obj = cached_email(email)
         user = self.user_repository.get_user_by_email(email_obj)
-        if not user:
-            raise ValueError("Invalid credentials")
         
         # Check if user is active
-        if not user.is_active:
+        if user and not user.is_active:
             raise ValueError("Account is deactivated")
         
-        # Verify password
-        if not self.password_service.verify_password(password, user.hashed_password):
+        # Verify password off the event loop (bcrypt releases the GIL). Unknown
+        # emails are checked against a dummy hash so they take as long to reject
+        # as a wrong password.
+        password_valid = await asyncio.to_thread(
+            self.password_service.verify_password,
+            password,
+            user.hashed_password if user else _DUMMY_PASSWORD_HASH
+        )
+        if not user or not password_valid:
             raise ValueError("Invalid credentials")
         
         # Create tokens
@@ -81,20 +92,15 @@ class LoginUserUseCase:
             "access_token": tokens["access_token"],
             "refresh_token": tokens["refresh_token"],
             "token_type": tokens["token_type"],
-            "user": {
-                "id": user.id.value,
-                "email": user.email.value,
-                "first_name": user.first_name,
-                "last_name": user.last_name,
-                "full_name": user.full_name,
-                "is_active": user.is_active,
-                "is_verified": user.is_verified
-            }
+            "user": user.to_public_dict()
         }
 
 class RefreshTokenUseCase:
     """Refresh token use case"""
     
+    # Reissue the refresh token only once it has less than this left to live
+    REFRESH_ROTATION_THRESHOLD_SECONDS = 24 * 60 * 60
+    
     def __init__(self, jwt_service: JWTService, user_repository: SQLiteUserRepository):
         self.jwt_service = jwt_service
         self.user_repository = user_repository
@@ -107,18 +113,21 @@ class RefreshTokenUseCase:
             raise ValueError("Invalid refresh token")
         
         # Get user
-        user_id = UserId(payload["sub"])
-        user = self.user_repository.get_user_by_id(user_id)
-        if not user or not user.is_active:
+        user_id = cached_user_id(payload["sub"])
+        user = self.user_repository.get_active_user_by_id(user_id)
+        if not user:
             raise ValueError("User not found or inactive")
         
-        # Create new access token
-        new_tokens = self.jwt_service.create_token_pair(user.id.value, user.email.value)
+        # Create new access token, keeping the refresh token until near expiry
+        data = {"sub": user.id.value, "email": user.email.value}
+        access_token = self.jwt_service.create_access_token(data)
+        if payload["exp"] - time.time() < self.REFRESH_ROTATION_THRESHOLD_SECONDS:
+            refresh_token = self.jwt_service.create_refresh_token(data)
         
         return {
-            "access_token": new_tokens["access_token"],
-            "refresh_token": new_tokens["refresh_token"],
-            "token_type": new_tokens["token_type"]
+            "access_token": access_token,
+            "refresh_token": refresh_token,
+            "token_type": "bearer"
         }
 
 class GetCurrentUserUseCase:
@@ -136,20 +145,12 @@ class GetCurrentUserUseCase:
             raise ValueError("Invalid access token")
         
         # Get user
-        user_id = UserId(payload["sub"])
-        user = self.user_repository.get_user_by_id(user_id)
-        if not user or not user.is_active:
+        user_id = cached_user_id(payload["sub"])
+        user = self.user_repository.get_active_user_by_id(user_id)
+        if not user:
             raise ValueError("User not found or inactive")
         
-        return {
-            "id": user.id.value,
-            "email": user.email.value,
-            "first_name": user.first_name,
-            "last_name": user.last_name,
-            "full_name": user.full_name,
-            "is_active": user.is_active,
-            "is_verified": user.is_verified
-        }
+        return user.to_public_dict()
 
 class LogoutUserUseCase:
     """Logout user use case"""
@@ -159,20 +160,17 @@ class LogoutUserUseCase:
     
     def execute(self, token: str) -> Dict[str, Any]:
         """Logout user by invalidating token"""
-        try:
-            # Validate token
-            payload = self.jwt_service.validate_token(token)
-            if not payload:
-                raise ValueError("Invalid token")
-            
-            # In a real implementation, you would add the token to a blacklist
-            # For now, we'll just return success
-            return {
-                "success": True,
-                "message": "User logged out successfully"
-            }
-        except Exception as e:
-            raise ValueError(f"Logout failed: {str(e)}")
+        # Validate token (verify_token returns None for expired/invalid tokens)
+        payload = self.jwt_service.verify_token(token)
+        if not payload:
+            raise ValueError("Logout failed: Invalid token")
+        
+        # In a real implementation, you would add the token to a blacklist
+        # For now, we'll just return success
+        return {
+            "success": True,
+            "message": "User logged out successfully"
+        }
 
 class VerifyEmailUseCase:
     """Verify email use case"""
@@ -183,19 +181,20 @@ class VerifyEmailUseCase:
     def execute(self, email: str, verification_code: str) -> Dict[str, Any]:
         """Verify user email with verification code"""
         try:
-            email_obj = Email(email)
-            user = self.user_repository.get_user_by_email(email_obj)
-            if not user:
-                raise ValueError("User not found")
-            
-            # In a real implementation, you would verify the code
-            # For now, we'll just mark the user as verified
-            user.verify()
-            self.user_repository.update_user(user)
-            
-            return {
-                "success": True,
-                "message": "Email verified successfully"
-            }
-        except Exception as e:
-            raise ValueError(f"Email verification failed: {str(e)}")
\ No newline at end of file
+            email_obj = cached_email(email)
+        except ValueError as e:
+            raise ValueError(f"Email verification failed: {e}")
+        
+        user = self.user_repository.get_user_by_email(email_obj)
+        if not user:
+            raise ValueError("Email verification failed: User not found")
+        
+        # In a real implementation, you would verify the code
+        # For now, we'll just mark the user as verified
+        user.verify()
+        self.user_repository.update_user(user)
+        
+        return {
+            "success": True,
+            "message": "Email verified successfully"
+        }
\ No newline at end of file
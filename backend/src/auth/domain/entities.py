@@ -21,9 +21,9 @@ class UserStatus(Enum):
     PENDING = "pending"
     SUSPENDED = "suspended"
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class User:
-    """User entity"""
+    """User entity (compared by identity, like other entities)"""
     id: UserId
     email: Email
     hashed_password: str
@@ -47,6 +47,18 @@ class User:
             return self.last_name
         return self.email.value
     
+    def to_public_dict(self) -> dict:
+        """Get the user fields that are safe to return to clients"""
+        return {
+            "id": self.id.value,
+            "email": self.email.value,
+            "first_name": self.first_name,
+            "last_name": self.last_name,
+            "full_name": self.full_name,
+            "is_active": self.is_active,
+            "is_verified": self.is_verified
+        }
+    
     def activate(self):
         """Activate user account"""
         self.is_active = True
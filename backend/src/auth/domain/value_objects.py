@@ -3,20 +3,24 @@ Auth Domain Value Objects
 """
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Optional
 
-@dataclass(frozen=True)
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\Z')
+_EMAIL_MAX_LENGTH = 254
+
+@dataclass(frozen=True, slots=True)
 class UserId:
     """User ID value object"""
     value: str
     
     def __post_init__(self):
-        if not self.value or len(self.value.strip()) == 0:
+        if not self.value or not self.value.strip():
             raise ValueError("User ID cannot be empty")
         if len(self.value) < 3:
             raise ValueError("User ID must be at least 3 characters long")
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Email:
     """Email value object"""
     value: str
@@ -25,15 +29,25 @@ class Email:
         if not self.value:
             raise ValueError("Email cannot be empty")
         
+        # Length first so overlong input never reaches the regex
+        if len(self.value) > _EMAIL_MAX_LENGTH:
+            raise ValueError("Email is too long")
+        
         # Basic email validation
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, self.value):
+        if _EMAIL_RE.match(self.value) is None:
             raise ValueError("Invalid email format")
-        
-        if len(self.value) > 254:
-            raise ValueError("Email is too long")
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=4096)
+def cached_email(value: str) -> Email:
+    """Build (and validate) an Email once per distinct address"""
+    return Email(value)
+
+@lru_cache(maxsize=4096)
+def cached_user_id(value: str) -> UserId:
+    """Build a UserId once per distinct value, for IDs that recur (token subjects)"""
+    return UserId(value)
+
+@dataclass(frozen=True, slots=True)
 class JWTToken:
     """JWT Token value object"""
     value: str
@@ -44,7 +58,7 @@ class JWTToken:
         if len(self.value) < 10:
             raise ValueError("JWT Token is too short")
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RefreshToken:
     """Refresh Token value object"""
     value: str
@@ -55,7 +69,7 @@ class RefreshToken:
         if len(self.value) < 10:
             raise ValueError("Refresh Token is too short")
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Password:
     """Password value object"""
     value: str
@@ -68,7 +82,7 @@ class Password:
         if len(self.value) > 128:
             raise ValueError("Password is too long")
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FirstName:
     """First Name value object"""
     value: str
@@ -76,12 +90,12 @@ class FirstName:
     def __post_init__(self):
         if not self.value:
             raise ValueError("First name cannot be empty")
-        if len(self.value) < 2:
-            raise ValueError("First name must be at least 2 characters long")
-        if len(self.value) > 50:
+        if not 2 <= len(self.value) <= 50:
+            if len(self.value) < 2:
+                raise ValueError("First name must be at least 2 characters long")
             raise ValueError("First name is too long")
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LastName:
     """Last Name value object"""
     value: str
@@ -89,12 +103,12 @@ class LastName:
     def __post_init__(self):
         if not self.value:
             raise ValueError("Last name cannot be empty")
-        if len(self.value) < 2:
-            raise ValueError("Last name must be at least 2 characters long")
-        if len(self.value) > 50:
+        if not 2 <= len(self.value) <= 50:
+            if len(self.value) < 2:
+                raise ValueError("Last name must be at least 2 characters long")
             raise ValueError("Last name is too long")
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LoginCredentials:
     """Login credentials value object"""
     email: Email
@@ -104,7 +118,7 @@ class LoginCredentials:
         if not self.email or not self.password:
             raise ValueError("Email and password are required")
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserRegistration:
     """User registration value object"""
     email: Email
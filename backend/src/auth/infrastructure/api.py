@@ -1,9 +1,10 @@
 """
 Auth API Endpoints
 """
+from functools import lru_cache
 from fastapi import APIRouter, HTTPException, Depends, status, Header
 from pydantic import BaseModel, EmailStr
-from typing import Optional
+from typing import Any, Dict, Optional
 from src.auth.application.use_cases import (
     RegisterUserUseCase, 
     LoginUserUseCase, 
@@ -53,8 +54,9 @@ class LoginResponse(BaseModel):
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 # Dependency injection
-def get_auth_services():
-    """Get authentication services"""
+@lru_cache(maxsize=1)
+def _build_auth_services() -> Dict[str, Any]:
+    """Build the authentication services once per process"""
     settings = Settings()
     jwt_service = JWTService(settings)
     password_service = PasswordService()
@@ -66,17 +68,20 @@ def get_auth_services():
         "user_repository": user_repository
     }
 
+async def get_auth_services() -> Dict[str, Any]:
+    """Get authentication services (override via app.dependency_overrides in tests)"""
+    return _build_auth_services()
+
 @router.post("/register", response_model=dict, status_code=status.HTTP_201_CREATED)
-async def register(request: RegisterRequest):
+async def register(request: RegisterRequest, services: Dict[str, Any] = Depends(get_auth_services)):
     """Register a new user"""
-    services = get_auth_services()
     use_case = RegisterUserUseCase(
         services["user_repository"],
         services["password_service"]
     )
     
     try:
-        result = use_case.execute(
+        result = await use_case.execute(
             email=request.email,
             password=request.password,
             first_name=request.first_name,
@@ -89,9 +94,8 @@ async def register(request: RegisterRequest):
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.post("/login", response_model=LoginResponse)
-async def login(request: LoginRequest):
+async def login(request: LoginRequest, services: Dict[str, Any] = Depends(get_auth_services)):
     """Login user"""
-    services = get_auth_services()
     use_case = LoginUserUseCase(
         services["user_repository"],
         services["password_service"],
@@ -99,7 +103,7 @@ async def login(request: LoginRequest):
     )
     
     try:
-        result = use_case.execute(
+        result = await use_case.execute(
             email=request.email,
             password=request.password
         )
@@ -110,9 +114,8 @@ async def login(request: LoginRequest):
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.post("/refresh", response_model=TokenResponse)
-async def refresh_token(request: RefreshTokenRequest):
+async def refresh_token(request: RefreshTokenRequest, services: Dict[str, Any] = Depends(get_auth_services)):
     """Refresh access token"""
-    services = get_auth_services()
     use_case = RefreshTokenUseCase(
         services["jwt_service"],
         services["user_repository"]
@@ -127,13 +130,15 @@ async def refresh_token(request: RefreshTokenRequest):
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user(authorization: str = Header(None, alias="Authorization")):
+async def get_current_user(
+    authorization: str = Header(None, alias="Authorization"),
+    services: Dict[str, Any] = Depends(get_auth_services)
+):
     """Get current user information"""
     if not authorization or not authorization.startswith("Bearer "):
         raise HTTPException(status_code=401, detail="Authorization header required")
     
-    token = authorization.split(" ")[1]
-    services = get_auth_services()
+    token = authorization[7:]
     use_case = GetCurrentUserUseCase(
         services["jwt_service"],
         services["user_repository"]
@@ -1,11 +1,20 @@
 """
 JWT Service Implementation with PyJWT
 """
+import base64
+import hashlib
+import hmac
+import json
+import time
 import jwt
-from datetime import datetime, timedelta
+from cachetools import TTLCache
 from typing import Optional, Dict, Any
 from src.shared.config import Settings
 
+def _b64url(data: bytes) -> bytes:
+    """Unpadded base64url, as used by JWS"""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
 class JWTService:
     """JWT Service for token generation and validation"""
     
@@ -14,34 +23,55 @@ class JWTService:
         self.algorithm = settings.jwt_algorithm
         self.access_token_expire_minutes = settings.jwt_access_token_expire_minutes
         self.refresh_token_expire_days = settings.jwt_refresh_token_expire_days
+        self._access_ttl_seconds = self.access_token_expire_minutes * 60
+        self._refresh_ttl_seconds = self.refresh_token_expire_days * 86400
+        # HS256 tokens are signed directly with hmac: the header is constant
+        self._hs256 = self.algorithm == "HS256"
+        self._header_b64 = _b64url(b'{"alg":"HS256","typ":"JWT"}')
+        self._key = self.secret_key.encode()
+        # Decoded payloads of recently verified tokens; hits are re-checked
+        # against the token's own exp so an expired token is never served
+        self._verify_cache = TTLCache(maxsize=10000, ttl=60)
+    
+    def _encode(self, payload: Dict[str, Any]) -> str:
+        """Sign payload; byte-for-byte what jwt.encode produces for HS256"""
+        if not self._hs256:
+            return jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
+        body = _b64url(json.dumps(payload, separators=(",", ":")).encode())
+        signing_input = self._header_b64 + b"." + body
+        signature = _b64url(hmac.new(self._key, signing_input, hashlib.sha256).digest())
+        return (signing_input + b"." + signature).decode()
     
     def create_access_token(self, data: Dict[str, Any]) -> str:
         """Create access token"""
-        to_encode = data.copy()
-        expire = datetime.utcnow() + timedelta(minutes=self.access_token_expire_minutes)
-        to_encode.update({"exp": expire, "type": "access"})
+        to_encode = {**data, "exp": int(time.time()) + self._access_ttl_seconds, "type": "access"}
         
-        encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
-        return encoded_jwt
+        return self._encode(to_encode)
     
     def create_refresh_token(self, data: Dict[str, Any]) -> str:
         """Create refresh token"""
-        to_encode = data.copy()
-        expire = datetime.utcnow() + timedelta(days=self.refresh_token_expire_days)
-        to_encode.update({"exp": expire, "type": "refresh"})
+        to_encode = {**data, "exp": int(time.time()) + self._refresh_ttl_seconds, "type": "refresh"}
         
-        encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
-        return encoded_jwt
+        return self._encode(to_encode)
     
     def verify_token(self, token: str) -> Optional[Dict[str, Any]]:
         """Verify and decode token"""
+        payload = self._verify_cache.get(token)
+        if payload is not None and payload["exp"] > time.time():
+            # Callers may add claims; keep the cached payload untouched
+            return dict(payload)
+        
         try:
             payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
-            return payload
         except jwt.ExpiredSignatureError:
             return None
         except jwt.InvalidTokenError:
             return None
+        
+        # Only successful verifications are cached
+        if "exp" in payload:
+            self._verify_cache[token] = dict(payload)
+        return payload
     
     def verify_access_token(self, token: str) -> Optional[Dict[str, Any]]:
         """Verify access token specifically"""
@@ -59,10 +89,12 @@ class JWTService:
     
     def create_token_pair(self, user_id: str, email: str) -> Dict[str, str]:
         """Create both access and refresh tokens"""
-        data = {"sub": user_id, "email": email}
+        now = int(time.time())
+        access_payload = {"sub": user_id, "email": email, "exp": now + self._access_ttl_seconds, "type": "access"}
+        refresh_payload = {"sub": user_id, "email": email, "exp": now + self._refresh_ttl_seconds, "type": "refresh"}
         
         return {
-            "access_token": self.create_access_token(data),
-            "refresh_token": self.create_refresh_token(data),
+            "access_token": self._encode(access_payload),
+            "refresh_token": self._encode(refresh_payload),
             "token_type": "bearer"
         }
@@ -9,6 +9,10 @@ database connections, SQL queries, and data mapping.
 import sqlite3
 import asyncio
 from typing import List, Optional
+
+import aiosqlite
+from cachetools import TTLCache
+from dataclasses import replace
 from datetime import datetime
 
 from ..domain.entities import User, UserRole, UserStatus
@@ -23,6 +27,33 @@ from ..domain.repositories import (
 )
 
 
+# Users table with proper schema, plus indexes for performance
+_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS users (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        email TEXT NOT NULL UNIQUE,
+        password_hash TEXT NOT NULL,
+        first_name TEXT NOT NULL,
+        last_name TEXT NOT NULL,
+        role TEXT NOT NULL DEFAULT 'customer',
+        status TEXT NOT NULL DEFAULT 'pending_verification',
+        is_email_verified INTEGER NOT NULL DEFAULT 0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        last_login_at TIMESTAMP,
+        
+        -- Constraints
+        CHECK (role IN ('admin', 'customer', 'seller', 'moderator')),
+        CHECK (status IN ('active', 'inactive', 'suspended', 'pending_verification')),
+        CHECK (is_email_verified IN (0, 1))
+    );
+    CREATE INDEX IF NOT EXISTS idx_users_email ON users(email);
+    CREATE INDEX IF NOT EXISTS idx_users_role ON users(role);
+    CREATE INDEX IF NOT EXISTS idx_users_status ON users(status);
+    CREATE INDEX IF NOT EXISTS idx_users_created_at ON users(created_at);
+'''
+
+
 class SQLiteUserRepository(UserRepository):
     """
     SQLite implementation of UserRepository.
@@ -31,60 +62,78 @@ class SQLiteUserRepository(UserRepository):
     using SQLite as the storage backend.
     """
     
-    def __init__(self, database_path: str):
+    # Columns in the order _user_from_row reads them
+    _COLS = (
+        "id, email, password_hash, first_name, last_name, role, status, "
+        "is_email_verified, created_at, updated_at, last_login_at"
+    )
+    _SQL_GET_BY_ID = f"SELECT {_COLS} FROM users WHERE id = ?"
+    _SQL_GET_BY_EMAIL = f"SELECT {_COLS} FROM users WHERE email = ?"
+    _SQL_FIND_ALL = f"SELECT {_COLS} FROM users ORDER BY created_at DESC LIMIT ? OFFSET ?"
+    
+    def __init__(self, database_path: str, cache_ttl: int = 30):
         self.database_path = database_path
+        self._conn: Optional[aiosqlite.Connection] = None
+        self._connect_lock = asyncio.Lock()
+        # email string -> User, for repeat logins; invalidated on save/delete.
+        # The id -> email side index lets a write find its entry directly.
+        self._by_email_cache: TTLCache = TTLCache(maxsize=4096, ttl=cache_ttl)
+        self._cached_email_by_id: TTLCache = TTLCache(maxsize=4096, ttl=cache_ttl)
         self._ensure_database_exists()
     
     def _ensure_database_exists(self):
         """Ensure database and tables exist"""
+        # The script is all IF NOT EXISTS, so rerunning it is cheap and also
+        # recovers a database file that was deleted and recreated
         try:
             conn = sqlite3.connect(self.database_path)
-            cursor = conn.cursor()
-            
-            # Create users table with proper schema
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS users (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    email TEXT NOT NULL UNIQUE,
-                    password_hash TEXT NOT NULL,
-                    first_name TEXT NOT NULL,
-                    last_name TEXT NOT NULL,
-                    role TEXT NOT NULL DEFAULT 'customer',
-                    status TEXT NOT NULL DEFAULT 'pending_verification',
-                    is_email_verified INTEGER NOT NULL DEFAULT 0,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    last_login_at TIMESTAMP,
-                    
-                    -- Constraints
-                    CHECK (role IN ('admin', 'customer', 'seller', 'moderator')),
-                    CHECK (status IN ('active', 'inactive', 'suspended', 'pending_verification')),
-                    CHECK (is_email_verified IN (0, 1))
-                )
-            ''')
-            
-            # Create indexes for performance
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_users_email ON users(email)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_users_role ON users(role)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_users_status ON users(status)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_users_created_at ON users(created_at)')
-            
-            conn.commit()
+            conn.executescript(_SCHEMA)
             conn.close()
             
         except Exception as e:
             raise UserRepositoryConnectionError(f"Failed to initialize database: {e}")
     
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get database connection with proper configuration"""
-        try:
-            conn = sqlite3.connect(self.database_path)
-            conn.execute("PRAGMA foreign_keys = ON")
-            conn.execute("PRAGMA journal_mode = WAL")
-            conn.execute("PRAGMA synchronous = NORMAL")
-            return conn
-        except Exception as e:
-            raise UserRepositoryConnectionError(f"Failed to connect to database: {e}")
+    async def _get_connection(self) -> aiosqlite.Connection:
+        """
+        Get the shared database connection, opening it on first use.
+        
+        The connection runs in autocommit mode (every statement here is a
+        single write or read) on aiosqlite's worker thread, so queries never
+        block the event loop. PRAGMAs are applied once when it is opened.
+        """
+        if self._conn is not None:
+            return self._conn
+        async with self._connect_lock:
+            if self._conn is None:
+                try:
+                    conn = await aiosqlite.connect(self.database_path, isolation_level=None)
+                    await conn.execute("PRAGMA foreign_keys = ON")
+                    await conn.execute("PRAGMA journal_mode = WAL")
+                    await conn.execute("PRAGMA synchronous = NORMAL")
+                    self._conn = conn
+                except Exception as e:
+                    raise UserRepositoryConnectionError(f"Failed to connect to database: {e}")
+        return self._conn
+    
+    async def close(self) -> None:
+        """Close the shared database connection"""
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
+    
+    def _cache_user(self, email: str, user: User) -> None:
+        """Cache a private copy of a user under its email"""
+        self._by_email_cache[email] = replace(user)
+        self._cached_email_by_id[user.id] = email
+    
+    def _evict_user(self, user_id: Optional[int], email: Optional[str] = None) -> None:
+        """Drop a user from the email cache after it changes"""
+        if email is not None:
+            self._by_email_cache.pop(email, None)
+        # The stored email may differ (update) or be unknown (delete)
+        cached_email = self._cached_email_by_id.pop(user_id, None)
+        if cached_email is not None:
+            self._by_email_cache.pop(cached_email, None)
     
     def _user_from_row(self, row: tuple) -> User:
         """Convert database row to User entity"""
@@ -108,12 +157,11 @@ class SQLiteUserRepository(UserRepository):
     async def save(self, user: User) -> User:
         """Save or update a user"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            conn = await self._get_connection()
             
             if user.id is None:
                 # Insert new user
-                cursor.execute('''
+                async with conn.execute('''
                     INSERT INTO users (
                         email, password_hash, first_name, last_name, role, status,
                         is_email_verified, created_at, updated_at, last_login_at
@@ -129,11 +177,8 @@ class SQLiteUserRepository(UserRepository):
                     user.created_at.isoformat() if user.created_at else None,
                     user.updated_at.isoformat() if user.updated_at else None,
                     user.last_login_at.isoformat() if user.last_login_at else None
-                ))
-                
-                user_id = cursor.lastrowid
-                conn.commit()
-                conn.close()
+                )) as cursor:
+                    user_id = cursor.lastrowid
                 
                 # Return user with generated ID
                 return User(
@@ -151,7 +196,7 @@ class SQLiteUserRepository(UserRepository):
                 )
             else:
                 # Update existing user
-                cursor.execute('''
+                await conn.execute('''
                     UPDATE users SET
                         email = ?, password_hash = ?, first_name = ?, last_name = ?,
                         role = ?, status = ?, is_email_verified = ?, updated_at = ?, last_login_at = ?
@@ -169,8 +214,7 @@ class SQLiteUserRepository(UserRepository):
                     user.id
                 ))
                 
-                conn.commit()
-                conn.close()
+                self._evict_user(user.id, user.email)
                 return user
                 
         except sqlite3.IntegrityError as e:
@@ -183,35 +227,34 @@ class SQLiteUserRepository(UserRepository):
     async def get_by_id(self, user_id: int) -> Optional[User]:
         """Get a user by its ID"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('SELECT * FROM users WHERE id = ?', (user_id,))
-            row = cursor.fetchone()
-            conn.close()
+            conn = await self._get_connection()
+            rows = await conn.execute_fetchall(self._SQL_GET_BY_ID, (user_id,))
             
-            if not row:
+            if not rows:
                 return None
             
-            return self._user_from_row(row)
+            return self._user_from_row(rows[0])
             
         except Exception as e:
             raise UserRepositoryError(f"Failed to get user by ID: {e}")
     
     async def get_by_email(self, email: Email) -> Optional[User]:
         """Get a user by email address"""
+        cached = self._by_email_cache.get(email.value)
+        if cached is not None:
+            # User is mutable, so callers never share the cached instance
+            return replace(cached)
+        
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            conn = await self._get_connection()
+            rows = await conn.execute_fetchall(self._SQL_GET_BY_EMAIL, (email.value,))
             
-            cursor.execute('SELECT * FROM users WHERE email = ?', (email.value,))
-            row = cursor.fetchone()
-            conn.close()
-            
-            if not row:
+            if not rows:
                 return None
             
-            return self._user_from_row(row)
+            user = self._user_from_row(rows[0])
+            self._cache_user(email.value, user)
+            return user
             
         except Exception as e:
             raise UserRepositoryError(f"Failed to get user by email: {e}")
@@ -219,14 +262,10 @@ class SQLiteUserRepository(UserRepository):
     async def exists_by_email(self, email: Email) -> bool:
         """Check if a user exists with the given email"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('SELECT 1 FROM users WHERE email = ?', (email.value,))
-            result = cursor.fetchone()
-            conn.close()
+            conn = await self._get_connection()
+            rows = await conn.execute_fetchall('SELECT 1 FROM users WHERE email = ?', (email.value,))
             
-            return result is not None
+            return bool(rows)
             
         except Exception as e:
             raise UserRepositoryError(f"Failed to check user existence: {e}")
@@ -234,13 +273,11 @@ class SQLiteUserRepository(UserRepository):
     async def delete(self, user_id: int) -> bool:
         """Delete a user by ID"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            conn = await self._get_connection()
+            async with conn.execute('DELETE FROM users WHERE id = ?', (user_id,)) as cursor:
+                rows_affected = cursor.rowcount
             
-            cursor.execute('DELETE FROM users WHERE id = ?', (user_id,))
-            rows_affected = cursor.rowcount
-            conn.commit()
-            conn.close()
+            self._evict_user(user_id)
             
             return rows_affected > 0
             
@@ -250,17 +287,8 @@ class SQLiteUserRepository(UserRepository):
     async def find_all(self, limit: int = 50, offset: int = 0) -> List[User]:
         """Find all users with pagination"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT * FROM users 
-                ORDER BY created_at DESC 
-                LIMIT ? OFFSET ?
-            ''', (limit, offset))
-            
-            rows = cursor.fetchall()
-            conn.close()
+            conn = await self._get_connection()
+            rows = await conn.execute_fetchall(self._SQL_FIND_ALL, (limit, offset))
             
             return [self._user_from_row(row) for row in rows]
             
@@ -270,14 +298,10 @@ class SQLiteUserRepository(UserRepository):
     async def count(self) -> int:
         """Count total number of users"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('SELECT COUNT(*) FROM users')
-            result = cursor.fetchone()[0]
-            conn.close()
+            conn = await self._get_connection()
+            rows = await conn.execute_fetchall('SELECT COUNT(*) FROM users')
             
-            return result
+            return rows[0][0]
             
         except Exception as e:
             raise UserRepositoryError(f"Failed to count users: {e}")
@@ -8,9 +8,14 @@ JWT tokens, password hashing, and email sending.
 
 import jwt
 import bcrypt
+import hashlib
+import heapq
+import hmac
 import secrets
 import string
-from typing import Dict, Any, Optional, Set
+import time
+from collections import deque
+from typing import Deque, Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 
 from ..domain.services import JWTService, PasswordService, EmailService
@@ -26,11 +31,26 @@ class PyJWTService(JWTService):
     using the PyJWT library.
     """
     
-    def __init__(self, secret_key: str, algorithm: str = "HS256", access_token_expire_hours: int = 1):
+    def __init__(self, secret_key: str, algorithm: str = "HS256", access_token_expire_hours: int = 1,
+                 refresh_token_expire_days: int = 7):
         self.secret_key = secret_key
         self.algorithm = algorithm
         self.access_token_expire_hours = access_token_expire_hours
-        self.revoked_tokens: Set[str] = set()  # In production, use Redis or database
+        self.refresh_token_expire_days = refresh_token_expire_days
+        # HMAC-SHA256(refresh token) -> (user_id, expires_at). The digest is the
+        # lookup key, so verification is one dict hit rather than a comparison
+        # against every stored token, and the raw tokens are never kept.
+        # In production, persist this in user_sessions with an index on it
+        self.refresh_tokens: Dict[str, Tuple[int, float]] = {}
+        # (expires_at, digest) in creation order. Every token gets the same
+        # lifetime, so this is also expiry order and expired entries can be
+        # dropped from the front without scanning
+        self._refresh_expiry: Deque[Tuple[float, str]] = deque()
+        # jti -> exp of revoked tokens; entries are dropped once the token
+        # would have expired anyway. In production, use Redis or database
+        self.revoked_tokens: Dict[str, float] = {}
+        # Min-heap of (exp, key) so expired entries are found without a scan
+        self._revoked_expiry: List[Tuple[float, str]] = []
     
     def create_token(self, user_id: int, email: str, role: str, expires_delta: Optional[timedelta] = None) -> JWTToken:
         """Create a JWT token for a user"""
@@ -48,7 +68,8 @@ class PyJWTService(JWTService):
                 "role": role,
                 "exp": expire,
                 "iat": datetime.utcnow(),
-                "type": "access"
+                "type": "access",
+                "jti": secrets.token_urlsafe(16)
             }
             
             # Create token
@@ -62,13 +83,13 @@ class PyJWTService(JWTService):
     def verify_token(self, token: JWTToken) -> Dict[str, Any]:
         """Verify and decode a JWT token"""
         try:
-            # Check if token is revoked
-            if token.value in self.revoked_tokens:
-                raise Exception("Token has been revoked")
-            
             # Decode token
             payload = jwt.decode(token.value, self.secret_key, algorithms=[self.algorithm])
             
+            # Check if token is revoked
+            if self._revocation_key(token, payload) in self.revoked_tokens:
+                raise Exception("Token has been revoked")
+            
             # Check token type
             if payload.get("type") != "access":
                 raise Exception("Invalid token type")
@@ -90,50 +111,96 @@ class PyJWTService(JWTService):
             characters = string.ascii_letters + string.digits
             token = ''.join(secrets.choice(characters) for _ in range(token_length))
             
-            # In production, store refresh tokens in database with expiration
+            now = time.time()
+            self._prune_refresh_tokens(now)
+            
+            expires_at = now + self.refresh_token_expire_days * 86400
+            lookup = self._refresh_token_lookup(token)
+            self.refresh_tokens[lookup] = (user_id, expires_at)
+            self._refresh_expiry.append((expires_at, lookup))
             return RefreshToken(token)
             
         except Exception as e:
             raise Exception(f"Failed to create refresh token: {e}")
     
+    def _refresh_token_lookup(self, token: str) -> str:
+        """Keyed digest of a refresh token, used as its storage index"""
+        return hmac.new(self.secret_key.encode(), token.encode(), hashlib.sha256).hexdigest()
+    
+    def _prune_refresh_tokens(self, now: float) -> None:
+        """Forget refresh tokens that have expired"""
+        expiry = self._refresh_expiry
+        while expiry and expiry[0][0] <= now:
+            self.refresh_tokens.pop(expiry.popleft()[1], None)
+    
     def verify_refresh_token(self, refresh_token: RefreshToken) -> int:
         """Verify a refresh token and return user ID"""
         try:
-            # In production, verify against database
-            # For now, we'll use a simple approach
-            # In a real implementation, you'd store refresh tokens in the database
-            # with user_id and expiration time
-            
-            # This is a simplified implementation
-            # In production, you should:
-            # 1. Store refresh tokens in database
-            # 2. Check expiration
-            # 3. Verify token exists and is not revoked
-            
-            # For demo purposes, we'll extract user_id from a simple encoding
-            # In production, use proper database lookup
-            if len(refresh_token.value) < 32:
-                raise Exception("Invalid refresh token format")
-            
-            # This is a placeholder - in production, lookup in database
-            # For now, we'll return a default user_id
-            # You should implement proper token-to-user mapping
-            return 1  # Placeholder user_id
+            lookup = self._refresh_token_lookup(refresh_token.value)
+            entry = self.refresh_tokens.get(lookup)
+            if entry is None:
+                raise Exception("Unknown refresh token")
+            
+            user_id, expires_at = entry
+            if expires_at <= time.time():
+                del self.refresh_tokens[lookup]
+                raise Exception("Refresh token has expired")
+            
+            return user_id
             
         except Exception as e:
             raise Exception(f"Refresh token verification failed: {e}")
     
+    def revoke_refresh_token(self, refresh_token: RefreshToken) -> bool:
+        """Invalidate a refresh token, e.g. on logout or after rotating it"""
+        lookup = self._refresh_token_lookup(refresh_token.value)
+        return self.refresh_tokens.pop(lookup, None) is not None
+    
+    @staticmethod
+    def _revocation_key(token: JWTToken, payload: Dict[str, Any]) -> str:
+        """Blacklist key: the jti claim, or the raw token for tokens without one"""
+        return payload.get("jti") or token.value
+    
     def revoke_token(self, token: JWTToken) -> bool:
         """Revoke a JWT token (add to blacklist)"""
         try:
-            self.revoked_tokens.add(token.value)
+            # Only tokens we signed can be revoked, so the blacklist can't be
+            # filled with arbitrary strings; expired tokens need no entry
+            payload = jwt.decode(
+                token.value, self.secret_key, algorithms=[self.algorithm],
+                options={"verify_exp": False}
+            )
+        except jwt.InvalidTokenError:
+            return False
+        
+        try:
+            self._prune_revoked_tokens(time.time())
+            
+            key = self._revocation_key(token, payload)
+            exp = payload.get("exp", float("inf"))
+            self.revoked_tokens[key] = exp
+            heapq.heappush(self._revoked_expiry, (exp, key))
             return True
         except Exception as e:
             raise Exception(f"Failed to revoke token: {e}")
     
+    def _prune_revoked_tokens(self, now: float) -> None:
+        """Forget revoked tokens that have expired anyway"""
+        expiry = self._revoked_expiry
+        while expiry and expiry[0][0] <= now:
+            exp, key = heapq.heappop(expiry)
+            # Skip if the key was revoked again with a later exp
+            if self.revoked_tokens.get(key) == exp:
+                del self.revoked_tokens[key]
+    
     def is_token_revoked(self, token: JWTToken) -> bool:
         """Check if a token is revoked"""
-        return token.value in self.revoked_tokens
+        try:
+            payload = jwt.decode(token.value, options={"verify_signature": False})
+        except jwt.InvalidTokenError:
+            # revoke_token only accepts decodable tokens
+            return False
+        return self._revocation_key(token, payload) in self.revoked_tokens
 
 
 class BCryptPasswordService(PasswordService):
@@ -2,6 +2,7 @@
 User Repository Implementation with SQLite
 """
 import sqlite3
+import threading
 from typing import Optional, List
 from datetime import datetime
 from src.auth.domain.entities import User
@@ -12,12 +13,26 @@ class SQLiteUserRepository:
     
     def __init__(self, db_path: str):
         self.db_path = db_path
+        self._local = threading.local()
         self._init_database()
     
+    def _conn(self) -> sqlite3.Connection:
+        """Persistent autocommit connection for the calling thread"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+            conn.executescript('''
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+                PRAGMA temp_store=MEMORY;
+                PRAGMA cache_size=-20000;
+            ''')
+            self._local.conn = conn
+        return conn
+    
     def _init_database(self):
         """Initialize database tables"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn().cursor()
         
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS users (
@@ -43,14 +58,10 @@ class SQLiteUserRepository:
                 FOREIGN KEY (user_id) REFERENCES users (id)
             )
         ''')
-        
-        conn.commit()
-        conn.close()
     
     def create_user(self, user: User) -> User:
         """Create a new user"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn().cursor()
         
         try:
             cursor.execute('''
@@ -65,21 +76,27 @@ class SQLiteUserRepository:
                 user.is_active,
                 user.is_verified
             ))
-            conn.commit()
             return user
         except sqlite3.IntegrityError:
             raise ValueError("User with this email already exists")
-        finally:
-            conn.close()
     
     def get_user_by_id(self, user_id: UserId) -> Optional[User]:
         """Get user by ID"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn().cursor()
         
         cursor.execute('SELECT * FROM users WHERE id = ?', (user_id.value,))
         row = cursor.fetchone()
-        conn.close()
+        
+        if row:
+            return self._row_to_user(row)
+        return None
+    
+    def get_active_user_by_id(self, user_id: UserId) -> Optional[User]:
+        """Get user by ID, or None if missing or inactive"""
+        cursor = self._conn().cursor()
+        
+        cursor.execute('SELECT * FROM users WHERE id = ? AND is_active = 1', (user_id.value,))
+        row = cursor.fetchone()
         
         if row:
             return self._row_to_user(row)
@@ -87,12 +104,10 @@ class SQLiteUserRepository:
     
     def get_user_by_email(self, email: Email) -> Optional[User]:
         """Get user by email"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn().cursor()
         
         cursor.execute('SELECT * FROM users WHERE email = ?', (email.value,))
         row = cursor.fetchone()
-        conn.close()
         
         if row:
             return self._row_to_user(row)
@@ -100,8 +115,7 @@ class SQLiteUserRepository:
     
     def update_user(self, user: User) -> User:
         """Update user information"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn().cursor()
         
         cursor.execute('''
             UPDATE users 
@@ -118,26 +132,18 @@ class SQLiteUserRepository:
             user.id.value
         ))
         
-        conn.commit()
-        conn.close()
         return user
     
     def delete_user(self, user_id: UserId) -> bool:
         """Delete user"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn().cursor()
         
         cursor.execute('DELETE FROM users WHERE id = ?', (user_id.value,))
-        deleted = cursor.rowcount > 0
-        
-        conn.commit()
-        conn.close()
-        return deleted
+        return cursor.rowcount > 0
     
     def list_users(self, limit: int = 100, offset: int = 0) -> List[User]:
         """List users with pagination"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn().cursor()
         
         cursor.execute('''
             SELECT * FROM users 
@@ -146,7 +152,6 @@ class SQLiteUserRepository:
         ''', (limit, offset))
         
         rows = cursor.fetchall()
-        conn.close()
         
         return [self._row_to_user(row) for row in rows]
     
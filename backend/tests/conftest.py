@@ -39,9 +39,11 @@ def temp_database() -> Generator[str, None, None]:
 
 
 @pytest.fixture
-async def user_repository(temp_database: str) -> SQLiteUserRepository:
+async def user_repository(temp_database: str) -> AsyncGenerator[SQLiteUserRepository, None]:
     """Create a user repository with temporary database."""
-    return SQLiteUserRepository(temp_database)
+    repository = SQLiteUserRepository(temp_database)
+    yield repository
+    await repository.close()
 
 
 @pytest.fixture
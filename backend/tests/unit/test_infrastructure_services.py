@@ -0,0 +1,135 @@
+"""
+Tests for the PyJWT token service in the infrastructure layer.
+"""
+
+import heapq
+import time
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from src.auth.domain.value_objects import JWTToken, RefreshToken
+from src.auth.infrastructure import services
+from src.auth.infrastructure.services import PyJWTService
+
+
+SECRET_KEY = "test-secret-key-with-enough-length"
+
+
+class TestPyJWTServiceRevocation:
+    """Access token blacklist tests"""
+
+    def test_revoked_token_fails_verification(self):
+        """Test a revoked token no longer verifies while other tokens still do"""
+        service = PyJWTService(SECRET_KEY)
+        token = service.create_token(1, "test@example.com", "customer")
+        other = service.create_token(1, "test@example.com", "customer")
+
+        assert service.revoke_token(token) is True
+
+        assert service.is_token_revoked(token) is True
+        assert service.is_token_revoked(other) is False
+        with pytest.raises(Exception, match="revoked"):
+            service.verify_token(token)
+        assert service.verify_token(other)["user_id"] == 1
+
+    def test_tokens_are_revoked_by_jti(self):
+        """Test the blacklist holds jti claims rather than whole tokens"""
+        service = PyJWTService(SECRET_KEY)
+        token = service.create_token(1, "test@example.com", "customer")
+        payload = service.verify_token(token)
+
+        service.revoke_token(token)
+
+        assert list(service.revoked_tokens) == [payload["jti"]]
+        assert service.revoked_tokens[payload["jti"]] == payload["exp"]
+
+    def test_revoke_undecodable_token_returns_false(self):
+        """Test tokens that don't carry our signature are not blacklisted"""
+        service = PyJWTService(SECRET_KEY)
+        forged = PyJWTService("another-secret-key-of-enough-length").create_token(1, "test@example.com", "customer")
+
+        assert service.revoke_token(JWTToken("x" * 60)) is False
+        assert service.revoke_token(forged) is False
+        assert service.revoked_tokens == {}
+        assert service.is_token_revoked(JWTToken("x" * 60)) is False
+
+    def test_expired_entries_are_pruned(self):
+        """Test revoking prunes expired entries but keeps a key re-revoked with a later exp"""
+        service = PyJWTService(SECRET_KEY)
+        expired = service.create_token(1, "test@example.com", "customer", expires_delta=timedelta(seconds=-5))
+        service.revoke_token(expired)
+
+        # A key revoked twice, the second time with a later exp: its stale
+        # heap entry must not drop the live one
+        now = time.time()
+        heapq.heappush(service._revoked_expiry, (now - 1, "re-revoked"))
+        heapq.heappush(service._revoked_expiry, (now + 3600, "re-revoked"))
+        service.revoked_tokens["re-revoked"] = now + 3600
+
+        live = service.create_token(1, "test@example.com", "customer")
+        service.revoke_token(live)
+
+        assert service.is_token_revoked(expired) is False
+        assert "re-revoked" in service.revoked_tokens
+        assert service.is_token_revoked(live) is True
+        assert len(service.revoked_tokens) == 2
+
+
+class TestPyJWTServiceRefreshTokens:
+    """Refresh token index tests"""
+
+    def test_refresh_token_verifies_to_its_user(self):
+        """Test each refresh token maps back to the user it was issued for"""
+        service = PyJWTService(SECRET_KEY)
+        first = service.create_refresh_token(42)
+        second = service.create_refresh_token(7)
+
+        assert service.verify_refresh_token(first) == 42
+        assert service.verify_refresh_token(second) == 7
+        assert first.value not in service.refresh_tokens
+
+    def test_unknown_refresh_token_raises(self):
+        """Test a well-formed token that was never issued is rejected"""
+        service = PyJWTService(SECRET_KEY)
+        service.create_refresh_token(42)
+
+        with pytest.raises(Exception, match="Unknown refresh token"):
+            service.verify_refresh_token(RefreshToken("a" * 64))
+
+    def test_expired_refresh_token_raises_and_is_dropped(self):
+        """Test an expired refresh token is rejected and forgotten"""
+        service = PyJWTService(SECRET_KEY, refresh_token_expire_days=0)
+        token = service.create_refresh_token(42)
+
+        with pytest.raises(Exception, match="expired"):
+            service.verify_refresh_token(token)
+        assert service.refresh_tokens == {}
+
+    def test_revoked_refresh_token_raises(self):
+        """Test revoke_refresh_token makes a token unverifiable"""
+        service = PyJWTService(SECRET_KEY)
+        token = service.create_refresh_token(42)
+
+        assert service.revoke_refresh_token(token) is True
+        assert service.revoke_refresh_token(token) is False
+        with pytest.raises(Exception, match="Unknown refresh token"):
+            service.verify_refresh_token(token)
+
+    def test_prune_refresh_tokens_removes_old_digests(self, monkeypatch):
+        """Test expired digests are dropped from the front of the expiry queue"""
+        clock = SimpleNamespace(time=lambda: 1000.0)
+        monkeypatch.setattr(services, "time", clock)
+        service = PyJWTService(SECRET_KEY)
+        old = service.create_refresh_token(1)
+        clock.time = lambda: 2000.0
+        new = service.create_refresh_token(2)
+
+        service._prune_refresh_tokens(1000.0 + 7 * 86400)
+
+        assert len(service.refresh_tokens) == 1
+        assert len(service._refresh_expiry) == 1
+        assert service.verify_refresh_token(new) == 2
+        with pytest.raises(Exception, match="Unknown refresh token"):
+            service.verify_refresh_token(old)
@@ -2,22 +2,29 @@
 Simple authentication tests that only test what we have implemented.
 """
 
+import time
+
+import jwt
 import pytest
 from unittest.mock import Mock
 
 from src.auth.domain.entities import User, UserRole, UserStatus
 from src.auth.domain.value_objects import Email, Password, FirstName, LastName
 from src.auth.application.use_cases import (
-    RegisterUserUseCase, LoginUserUseCase, LogoutUserUseCase, VerifyEmailUseCase
+    RegisterUserUseCase, LoginUserUseCase, LogoutUserUseCase, VerifyEmailUseCase,
+    RefreshTokenUseCase,
+    _DUMMY_PASSWORD_HASH
 )
 from src.auth.infrastructure.password_service import PasswordService
 from src.auth.infrastructure.jwt_service import JWTService
+from src.shared.config import Settings
 
 
 class TestSimpleAuth:
     """Simple authentication tests"""
     
-    def test_register_user_success(self):
+    @pytest.mark.asyncio
+    async def test_register_user_success(self):
         """Test successful user registration"""
         # Mock dependencies
         mock_repo = Mock()
@@ -37,7 +44,7 @@ class TestSimpleAuth:
         use_case = RegisterUserUseCase(mock_repo, password_service)
         
         # Execute
-        result = use_case.execute("test@example.com", "StrongPassword123!", "John", "Doe")
+        result = await use_case.execute("test@example.com", "StrongPassword123!", "John", "Doe")
         
         # Assertions
         assert result["user_id"] == "user_12345678"
@@ -45,7 +52,8 @@ class TestSimpleAuth:
         assert result["message"] == "User registered successfully"
         mock_repo.create_user.assert_called_once()
     
-    def test_register_user_already_exists(self):
+    @pytest.mark.asyncio
+    async def test_register_user_already_exists(self):
         """Test registration when user already exists"""
         # Mock dependencies
         mock_repo = Mock()
@@ -66,9 +74,10 @@ class TestSimpleAuth:
         
         # Execute and assert
         with pytest.raises(ValueError, match="User with this email already exists"):
-            use_case.execute("test@example.com", "StrongPassword123!", "John", "Doe")
+            await use_case.execute("test@example.com", "StrongPassword123!", "John", "Doe")
     
-    def test_login_user_success(self):
+    @pytest.mark.asyncio
+    async def test_login_user_success(self):
         """Test successful user login"""
         # Mock dependencies
         mock_repo = Mock()
@@ -95,7 +104,7 @@ class TestSimpleAuth:
         use_case = LoginUserUseCase(mock_repo, password_service, jwt_service)
         
         # Execute
-        result = use_case.execute("test@example.com", "password123")
+        result = await use_case.execute("test@example.com", "password123")
         
         # Assertions
         assert result["access_token"] == "jwt_token"
@@ -103,11 +112,88 @@ class TestSimpleAuth:
         assert result["token_type"] == "bearer"
         assert result["user"]["email"] == "test@example.com"
     
+    @pytest.mark.asyncio
+    async def test_login_unknown_email_still_verifies_password(self):
+        """Test login with an unknown email runs bcrypt against the dummy hash"""
+        # Mock dependencies
+        mock_repo = Mock()
+        mock_repo.get_user_by_email.return_value = None
+        
+        password_service = Mock()
+        password_service.verify_password.return_value = True
+        
+        # Create use case
+        use_case = LoginUserUseCase(mock_repo, password_service, Mock())
+        
+        # Execute and assert
+        with pytest.raises(ValueError, match="Invalid credentials"):
+            await use_case.execute("unknown@example.com", "password123")
+        password_service.verify_password.assert_called_once_with("password123", _DUMMY_PASSWORD_HASH)
+    
+    def test_refresh_token_keeps_long_lived_refresh_token(self):
+        """Test refresh only mints an access token while the refresh token is fresh"""
+        # Mock dependencies
+        mock_repo = Mock()
+        mock_repo.get_active_user_by_id.return_value = User(
+            id=Mock(value="user_123"),
+            email=Email("test@example.com"),
+            hashed_password="hashed"
+        )
+        
+        jwt_service = Mock()
+        jwt_service.verify_refresh_token.return_value = {
+            "sub": "user_123",
+            "exp": time.time() + 7 * 24 * 60 * 60
+        }
+        jwt_service.create_access_token.return_value = "new_access_token"
+        
+        # Create use case
+        use_case = RefreshTokenUseCase(jwt_service, mock_repo)
+        
+        # Execute
+        result = use_case.execute("refresh_token")
+        
+        # Assertions
+        assert result["access_token"] == "new_access_token"
+        assert result["refresh_token"] == "refresh_token"
+        jwt_service.create_refresh_token.assert_not_called()
+    
+    def test_refresh_token_rotates_near_expiry(self):
+        """Test refresh reissues the refresh token once it expires within a day"""
+        # Mock dependencies
+        mock_repo = Mock()
+        mock_repo.get_active_user_by_id.return_value = User(
+            id=Mock(value="user_123"),
+            email=Email("test@example.com"),
+            hashed_password="hashed"
+        )
+        
+        jwt_service = Mock()
+        jwt_service.verify_refresh_token.return_value = {
+            "sub": "user_123",
+            "exp": time.time() + 60 * 60
+        }
+        jwt_service.create_access_token.return_value = "new_access_token"
+        jwt_service.create_refresh_token.return_value = "new_refresh_token"
+        
+        # Create use case
+        use_case = RefreshTokenUseCase(jwt_service, mock_repo)
+        
+        # Execute
+        result = use_case.execute("refresh_token")
+        
+        # Assertions
+        assert result["access_token"] == "new_access_token"
+        assert result["refresh_token"] == "new_refresh_token"
+        jwt_service.create_refresh_token.assert_called_once_with(
+            {"sub": "user_123", "email": "test@example.com"}
+        )
+    
     def test_logout_user_success(self):
         """Test successful user logout"""
         # Mock dependencies
         jwt_service = Mock()
-        jwt_service.validate_token.return_value = {"sub": "123"}
+        jwt_service.verify_token.return_value = {"sub": "123"}
         
         # Create use case
         use_case = LogoutUserUseCase(jwt_service)
@@ -144,3 +230,34 @@ class TestSimpleAuth:
         assert result["message"] == "Email verified successfully"
         assert user.is_verified is True
         mock_repo.update_user.assert_called_once_with(user)
+    
+    def test_jwt_service_hs256_matches_pyjwt(self):
+        """Test the direct HS256 signer produces exactly what PyJWT would"""
+        jwt_service = JWTService(Settings())
+        
+        token = jwt_service.create_access_token({"sub": "user_123", "email": "test@example.com"})
+        payload = jwt.decode(token, jwt_service.secret_key, algorithms=["HS256"])
+        
+        assert token == jwt.encode(payload, jwt_service.secret_key, algorithm="HS256")
+        assert payload["type"] == "access"
+    
+    def test_jwt_service_verify_cache_returns_copies(self):
+        """Test mutating a verified payload does not leak into later verifications"""
+        jwt_service = JWTService(Settings())
+        token = jwt_service.create_access_token({"sub": "user_123"})
+        
+        first = jwt_service.verify_token(token)
+        first["role"] = "admin"
+        cached = jwt_service.verify_token(token)
+        cached["sub"] = "someone_else"
+        
+        payload = jwt_service.verify_token(token)
+        assert payload["sub"] == "user_123"
+        assert "role" not in payload
+    
+    @pytest.mark.parametrize("name_class, label", [(FirstName, "First"), (LastName, "Last")])
+    @pytest.mark.parametrize("value", [None, ""])
+    def test_name_value_objects_reject_missing_value(self, name_class, label, value):
+        """Test a missing name raises ValueError, not TypeError from len()"""
+        with pytest.raises(ValueError, match=f"{label} name cannot be empty"):
+            name_class(value)